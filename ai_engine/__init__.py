@@ -6,29 +6,94 @@ preliminary health assessments and suggests natural remedies.
 Enhanced with ChatGPT-like natural language processing and advanced diagnosis.
 """
 
-from .diagnosis import diagnose
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+
+from .diagnosis import diagnose, _diagnose_normalized
 from .remedies import get_remedies, get_precautions
-from .safety import check_emergency
+from .safety import check_emergency, _check_emergency_normalized
 from .symptoms import SYMPTOM_MAP
 from .nlp_processor import SymptomNLPProcessor
 from .advanced_diagnosis import AdvancedDiagnosisEngine
-from .enhanced_remedies import EnhancedRemedySystem
+from .enhanced_remedies import (
+    EnhancedRemedySystem, get_remedy_system, get_emergency_remedies, get_condition_info
+)
 from .symptom_checker import ComprehensiveSymptomChecker
+from .text_normalization import normalize_text
 
 __version__ = "3.0.0"
 __all__ = [
     "diagnose", "get_remedies", "get_precautions", "check_emergency", "SYMPTOM_MAP", 
     "analyze_symptoms_conversational", "advanced_analyze_symptoms", "comprehensive_symptom_check",
-    "AdvancedDiagnosisEngine", "EnhancedRemedySystem", "ComprehensiveSymptomChecker"
+    "AdvancedDiagnosisEngine", "EnhancedRemedySystem", "ComprehensiveSymptomChecker", "get_remedy_system",
+    "get_nlp_processor",
+    "analyze_symptoms_iter", "analyze_symptoms_aiter", "analyze_many", "analyze_many_sync"
 ]
 
-# Initialize advanced systems
-nlp_processor = SymptomNLPProcessor()
-advanced_diagnosis_engine = AdvancedDiagnosisEngine()
-enhanced_remedy_system = EnhancedRemedySystem()
-comprehensive_symptom_checker = ComprehensiveSymptomChecker()
+# Advanced systems are created on first use so importing the package stays cheap
+@lru_cache(maxsize=None)
+def get_nlp_processor():
+    return SymptomNLPProcessor()
+
+
+@lru_cache(maxsize=None)
+def _get_advanced_diagnosis_engine():
+    return AdvancedDiagnosisEngine()
+
+
+@lru_cache(maxsize=None)
+def _get_comprehensive_symptom_checker():
+    return ComprehensiveSymptomChecker()
+
+
+_LAZY_SYSTEMS = {
+    "advanced_diagnosis_engine": _get_advanced_diagnosis_engine,
+    "enhanced_remedy_system": get_remedy_system,
+    "comprehensive_symptom_checker": _get_comprehensive_symptom_checker,
+}
+
 
+def __getattr__(name):
+    """Build the shared advanced systems lazily on attribute access (PEP 562)."""
+    if name in _LAZY_SYSTEMS:
+        return _LAZY_SYSTEMS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+# Number of distinct normalized inputs remembered by each analysis function
+ANALYSIS_CACHE_SIZE = 4096
+
+
+def _copy_result(value):
+    """Copy the dicts and lists of an analysis result, sharing immutable leaves."""
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    return value
+
+
+def _cached_analysis(function):
+    """
+    Memoize an analysis function on its normalized input text.
+    
+    Input is normalized once here, so the wrapped function receives
+    pre-normalized text. Results are copied on the way out so callers can freely modify
+    what they get back without corrupting the cache.
+    """
+    cached_function = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(function)
+    
+    @wraps(function)
+    def wrapper(symptom_text: str):
+        return _copy_result(cached_function(normalize_text(symptom_text)))
+    
+    wrapper.cache_clear = cached_function.cache_clear
+    wrapper.cache_info = cached_function.cache_info
+    return wrapper
+
+
+@_cached_analysis
 def analyze_symptoms(symptom_text: str):
     """
     Complete symptom analysis including emergency check, diagnosis, and remedies.
@@ -36,11 +101,24 @@ def analyze_symptoms(symptom_text: str):
     Args:
         symptom_text (str): Description of symptoms
         
+    Returns:
+        dict: Complete analysis including emergency status, diagnosis, remedies, and precautions
+    """
+    return _analyze_normalized(symptom_text)
+
+
+def _analyze_normalized(symptom_text: str):
+    """
+    Complete symptom analysis of already-normalized text.
+    
+    Args:
+        symptom_text (str): Normalized description of symptoms
+        
     Returns:
         dict: Complete analysis including emergency status, diagnosis, remedies, and precautions
     """
     # Check for emergency first
-    emergency_result = check_emergency(symptom_text)
+    emergency_result = _check_emergency_normalized(symptom_text)
     
     if emergency_result["emergency"]:
         return {
@@ -52,7 +130,7 @@ def analyze_symptoms(symptom_text: str):
         }
     
     # Perform diagnosis
-    diagnosis_result = diagnose(symptom_text)
+    diagnosis_result = _diagnose_normalized(symptom_text)
     
     # Get remedies and precautions for the diagnosed condition
     remedies = get_remedies(diagnosis_result["condition"])
@@ -67,6 +145,7 @@ def analyze_symptoms(symptom_text: str):
     }
 
 
+@_cached_analysis
 def advanced_analyze_symptoms(symptom_text: str):
     """
     Advanced symptom analysis with differential diagnosis and comprehensive remedies.
@@ -78,10 +157,10 @@ def advanced_analyze_symptoms(symptom_text: str):
         dict: Advanced analysis with multiple diagnoses, confidence scores, and comprehensive treatment
     """
     # Check for emergency first
-    emergency_result = check_emergency(symptom_text)
+    emergency_result = _check_emergency_normalized(symptom_text)
     
     if emergency_result["emergency"]:
-        emergency_remedies = enhanced_remedy_system.get_emergency_remedies(
+        emergency_remedies = get_emergency_remedies(
             emergency_result.get('suspected_condition', 'general')
         )
         return {
@@ -92,7 +171,7 @@ def advanced_analyze_symptoms(symptom_text: str):
         }
     
     # Perform advanced diagnosis
-    advanced_diagnosis = advanced_diagnosis_engine.advanced_diagnose(symptom_text)
+    advanced_diagnosis = _get_advanced_diagnosis_engine()._advanced_diagnose_normalized(symptom_text)
     
     if advanced_diagnosis['primary_diagnosis']['condition'] == 'unknown':
         return {
@@ -104,20 +183,17 @@ def advanced_analyze_symptoms(symptom_text: str):
     
     # Get comprehensive treatment information
     primary_condition = advanced_diagnosis['primary_diagnosis']['condition']
-    remedies = enhanced_remedy_system.get_remedies(primary_condition)
-    precautions = enhanced_remedy_system.get_precautions(primary_condition)
-    lifestyle_recommendations = enhanced_remedy_system.get_lifestyle_recommendations(primary_condition)
-    dietary_recommendations = enhanced_remedy_system.get_dietary_recommendations(primary_condition)
+    condition_info = get_condition_info(primary_condition)
     
     return {
         "type": "advanced_diagnosis",
         "primary_diagnosis": advanced_diagnosis['primary_diagnosis'],
         "differential_diagnosis": advanced_diagnosis.get('differential_diagnosis', []),
         "treatment_plan": {
-            "natural_remedies": remedies,
-            "medical_precautions": precautions,
-            "lifestyle_recommendations": lifestyle_recommendations,
-            "dietary_recommendations": dietary_recommendations
+            "natural_remedies": condition_info['remedies'],
+            "medical_precautions": condition_info['precautions'],
+            "lifestyle_recommendations": condition_info['lifestyle'],
+            "dietary_recommendations": condition_info['diet']
         },
         "extracted_symptoms": advanced_diagnosis.get('extracted_symptoms', []),
         "total_symptoms_analyzed": advanced_diagnosis.get('total_symptoms_analyzed', 0),
@@ -135,9 +211,10 @@ def comprehensive_symptom_check(symptom_text: str):
     Returns:
         dict: Comprehensive symptom check result with follow-up questions
     """
-    return comprehensive_symptom_checker.start_symptom_check(symptom_text)
+    return _get_comprehensive_symptom_checker().start_symptom_check(symptom_text)
 
 
+@_cached_analysis
 def analyze_symptoms_conversational(user_input: str):
     """
     ChatGPT-like conversational symptom analysis.
@@ -149,7 +226,7 @@ def analyze_symptoms_conversational(user_input: str):
         dict: Conversational response with analysis
     """
     # Process with NLP
-    nlp_result = nlp_processor.process_natural_language(user_input)
+    nlp_result = get_nlp_processor()._process_normalized_text(user_input)
     
     # Handle different types of input
     if nlp_result["type"] in ["greeting", "system_info", "clarification_needed"]:
@@ -160,12 +237,13 @@ def analyze_symptoms_conversational(user_input: str):
         }
     
     elif nlp_result["type"] == "symptoms_found":
-        # Analyze symptoms
+        # Analyze symptoms - the NLP output is already normalized and this
+        # whole response is cached, so skip analyze_symptoms' own cache layer
         symptoms_text = nlp_result["normalized_text"]
-        diagnosis_result = analyze_symptoms(symptoms_text)
+        diagnosis_result = _analyze_normalized(symptoms_text)
         
         # Generate conversational response
-        conversational_response = nlp_processor.generate_conversational_response(diagnosis_result)
+        conversational_response = get_nlp_processor().generate_conversational_response(diagnosis_result)
         
         return {
             "type": "medical_analysis",
@@ -180,4 +258,73 @@ def analyze_symptoms_conversational(user_input: str):
         return {
             "type": "general",
             "response": "I'm here to help with your health concerns. Please describe your symptoms and I'll do my best to provide helpful information."
-        }
\ No newline at end of file
+        }
+
+
+def analyze_symptoms_iter(symptom_texts: Iterable[str]) -> Iterator[dict]:
+    """
+    Analyze a batch of symptom descriptions, yielding each result as soon as it is ready.
+    
+    Args:
+        symptom_texts (Iterable[str]): Symptom descriptions, consumed lazily
+        
+    Yields:
+        dict: Complete analysis for each description, in input order
+    """
+    for symptom_text in symptom_texts:
+        yield analyze_symptoms(symptom_text)
+
+
+async def analyze_symptoms_aiter(symptom_texts: Iterable[str]) -> AsyncIterator[dict]:
+    """
+    Asynchronously analyze a batch of symptom descriptions without blocking the event loop.
+    
+    Args:
+        symptom_texts (Iterable[str]): Symptom descriptions, consumed lazily
+        
+    Yields:
+        dict: Complete analysis for each description, in input order
+    """
+    loop = asyncio.get_running_loop()
+    for symptom_text in symptom_texts:
+        # run_in_executor rather than asyncio.to_thread keeps Python 3.8 support
+        yield await loop.run_in_executor(None, analyze_symptoms, symptom_text)
+
+
+async def analyze_many(symptom_texts: Iterable[str], concurrency: int = 8) -> List[dict]:
+    """
+    Analyze many symptom descriptions concurrently from async code.
+    
+    The shared engines keep no per-request state, so analyses can safely
+    run side by side in worker threads.
+    
+    Args:
+        symptom_texts (Iterable[str]): Symptom descriptions to analyze
+        concurrency (int): Maximum number of analyses running at once
+        
+    Returns:
+        list: Complete analysis for each description, in input order
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def analyze_one(symptom_text: str) -> dict:
+        async with semaphore:
+            return await loop.run_in_executor(None, analyze_symptoms, symptom_text)
+    
+    return list(await asyncio.gather(*(analyze_one(text) for text in symptom_texts)))
+
+
+def analyze_many_sync(symptom_texts: Iterable[str], max_workers: Optional[int] = None) -> List[dict]:
+    """
+    Analyze many symptom descriptions concurrently on a thread pool.
+    
+    Args:
+        symptom_texts (Iterable[str]): Symptom descriptions to analyze
+        max_workers (int, optional): Thread pool size, defaults to the executor's CPU-based size
+        
+    Returns:
+        list: Complete analysis for each description, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze_symptoms, symptom_texts))
@@ -3,11 +3,97 @@ Advanced Medical Diagnosis Engine
 Enhanced with comprehensive symptom analysis and disease correlation
 """
 
-import json
-import os
 from collections import defaultdict, Counter
-from typing import List, Dict, Tuple, Set
+from typing import Iterable, List, Dict, Tuple, Set
 import re
+from .disk_cache import cache_key, load_cached, save_cached
+from .keyword_matcher import KeywordMatcher, available_backend
+from .symptoms import SYMPTOM_DATA_PATH, load_symptom_file
+from .text_normalization import normalize_text
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional - scoring falls back to the inverted index
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - NumPy scoring uses matrix-vector products instead
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _accumulate_postings(columns, column_weights, posting_offsets, posting_rows,
+                             matched_counts, weighted_scores):
+        """Walk the posting lists of the given symptom columns, tallying each disease row."""
+        for i in range(columns.shape[0]):
+            column = columns[i]
+            weight = column_weights[column]
+            for j in range(posting_offsets[column], posting_offsets[column + 1]):
+                row = posting_rows[j]
+                matched_counts[row] += 1.0
+                weighted_scores[row] += weight
+else:
+    _accumulate_postings = None
+
+DATA_PATH = SYMPTOM_DATA_PATH
+
+# Fully built engine state, reused while DATA_PATH keeps the same contents
+CACHE_NAME = 'symptoms.engine.pkl'
+
+# Bump when the cached engine state changes shape so old caches are rebuilt
+ENGINE_CACHE_VERSION = 2
+
+# Engine attributes derived from DATA_PATH that are stored under CACHE_NAME
+CACHED_ATTRIBUTES = (
+    'symptom_map', 'disease_symptoms', 'symptom_weights', 'disease_prevalence',
+    'disease_rank', 'symptom_diseases', 'symptom_aliases',
+    'symptom_matcher', 'disease_names', 'symptom_columns', 'score_matrix',
+    'match_matrix', 'disease_lengths', 'column_weights', 'posting_offsets', 'posting_rows'
+)
+
+# Common variations of symptom names used in natural language
+SYMPTOM_VARIATIONS = {
+    'headache': ['head pain', 'head ache', 'migraine'],
+    'stomach pain': ['belly pain', 'tummy ache', 'abdominal pain'],
+    'chest pain': ['chest ache', 'heart pain'],
+    'joint pain': ['arthritis pain', 'bone pain'],
+    'muscle pain': ['body ache', 'muscle ache'],
+    'high fever': ['fever', 'temperature', 'hot'],
+    'cough': ['coughing', 'dry cough'],
+    'vomiting': ['throwing up', 'nausea', 'sick'],
+    'diarrhea': ['loose motion', 'loose stool'],
+    'fatigue': ['tired', 'exhausted', 'weakness'],
+    'breathlessness': ['shortness of breath', 'difficulty breathing']
+}
+
+# Commonly reported symptoms offered as examples when nothing is recognized
+COMMON_SYMPTOMS = (
+    'fever', 'headache', 'cough', 'stomach pain', 'chest pain',
+    'fatigue', 'nausea', 'vomiting', 'diarrhea', 'joint pain',
+    'muscle pain', 'skin rash', 'breathlessness', 'dizziness'
+)
+
+# Follow-up questions that confirm or rule out a symptom
+SYMPTOM_TO_QUESTION = {
+    'high fever': 'Do you have a high fever (over 101°F/38.3°C)?',
+    'chest pain': 'Are you experiencing any chest pain or discomfort?',
+    'breathlessness': 'Do you have difficulty breathing or shortness of breath?',
+    'fatigue': 'Are you feeling unusually tired or fatigued?',
+    'headache': 'Do you have a headache?',
+    'nausea': 'Are you feeling nauseous or sick to your stomach?',
+    'vomiting': 'Have you been vomiting?',
+    'diarrhea': 'Do you have diarrhea or loose stools?',
+    'joint pain': 'Are you experiencing any joint pain?',
+    'muscle pain': 'Do you have muscle aches or pain?',
+    'skin rash': 'Do you have any skin rash or skin changes?',
+    'weight loss': 'Have you experienced unexplained weight loss?',
+    'loss of appetite': 'Have you lost your appetite?',
+    'sweating': 'Are you experiencing excessive sweating?',
+    'dizziness': 'Do you feel dizzy or lightheaded?'
+}
 
 class AdvancedDiagnosisEngine:
     """Advanced diagnosis engine with multi-symptom analysis and confidence scoring."""
@@ -17,77 +103,183 @@ class AdvancedDiagnosisEngine:
         self.disease_symptoms = {}
         self.symptom_weights = {}
         self.disease_prevalence = {}
-        self.load_medical_data()
-        self.calculate_symptom_weights()
+        self.disease_rank = {}
+        self.disease_symptom_sets = {}
+        self.symptom_diseases = {}
+        self.symptom_aliases = {}
+        self.symptom_matcher = None
+        self.phrase_order = {}
+        self.max_phrase_length = 0
+        self.symptom_suggestions = ()
+        self.disease_questions = {}
+        self.disease_names = []
+        self.symptom_columns = {}
+        self.score_matrix = None
+        self.match_matrix = None
+        self.disease_lengths = None
+        self.column_weights = None
+        self.posting_offsets = None
+        self.posting_rows = None
+        
+        if not self.load_cached_state():
+            self.load_medical_data()
+            self.calculate_symptom_weights()
+            self.build_symptom_matcher()
+            self.build_score_matrix()
+            self.save_cached_state()
+        
+        self.symptom_suggestions = tuple(s for s in COMMON_SYMPTOMS if s in self.symptom_map)
+        self.build_question_index()
+        
+        # Lets incremental callers restore the order find_all would report
+        self.phrase_order = {phrase: i for i, phrase in enumerate(self.symptom_matcher.keywords)}
+        self.max_phrase_length = max(map(len, self.phrase_order), default=0)
     
     def load_medical_data(self):
         """Load comprehensive medical data from symptoms.json."""
         try:
-            data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'symptoms.json')
-            with open(data_path, 'r') as f:
-                data = json.load(f)
+            data = load_symptom_file()
             
             self.symptom_map = data.get('symptom_map', {})
             self.disease_symptoms = data.get('disease_symptoms', {})
             
             # Calculate disease prevalence based on symptom count
-            for disease, symptoms in self.disease_symptoms.items():
+            for rank, (disease, symptoms) in enumerate(self.disease_symptoms.items()):
                 self.disease_prevalence[disease] = len(symptoms)
+                self.disease_rank[disease] = rank
+                self.disease_symptom_sets[disease] = frozenset(symptoms)
+                
+                # Inverted index so scoring only visits diseases a symptom points to
+                for symptom in dict.fromkeys(symptoms):
+                    self.symptom_diseases.setdefault(symptom, []).append(disease)
                 
         except Exception as e:
             print(f"Error loading medical data: {e}")
             self.symptom_map = {}
             self.disease_symptoms = {}
     
+    def _cache_signature(self) -> Tuple:
+        """Describe everything besides the data file that shapes the cached state."""
+        return (ENGINE_CACHE_VERSION, available_backend(), np is not None, SYMPTOM_VARIATIONS)
+    
+    def load_cached_state(self) -> bool:
+        """Restore a previously built engine if its cache is still current."""
+        try:
+            key = cache_key(self._cache_signature(), DATA_PATH)
+        except OSError:
+            return False
+        state = load_cached(CACHE_NAME, key)
+        if state is None:
+            return False
+        
+        self.__dict__.update(state)
+        # Rebuilt rather than unpickled so set iteration order matches a fresh build
+        self.disease_symptom_sets = {
+            disease: frozenset(symptoms) for disease, symptoms in self.disease_symptoms.items()
+        }
+        return True
+    
+    def save_cached_state(self):
+        """Store the built engine in the user cache directory for the next start-up."""
+        if not self.symptom_map:
+            return
+        
+        try:
+            key = cache_key(self._cache_signature(), DATA_PATH)
+        except OSError:
+            return
+        save_cached(CACHE_NAME, key, {name: getattr(self, name) for name in CACHED_ATTRIBUTES})
+    
     def calculate_symptom_weights(self):
         """Calculate weights for symptoms based on their specificity."""
-        symptom_disease_count = defaultdict(int)
-        
         # Count how many diseases each symptom appears in
-        for disease, symptoms in self.disease_symptoms.items():
-            for symptom in symptoms:
-                symptom_disease_count[symptom] += 1
+        symptom_disease_count = Counter(
+            symptom for symptoms in self.disease_symptoms.values() for symptom in symptoms
+        )
         
         # Calculate weights (more specific symptoms get higher weights)
         total_diseases = len(self.disease_symptoms)
+        if np is not None and symptom_disease_count:
+            # Inverse frequency weighting - rare symptoms are more diagnostic
+            disease_counts = np.fromiter(symptom_disease_count.values(), dtype=float, count=len(symptom_disease_count))
+            weights = np.maximum(1.0, total_diseases / disease_counts)
+            self.symptom_weights.update(zip(symptom_disease_count, weights.tolist()))
+            return
+        
         for symptom, disease_count in symptom_disease_count.items():
             # Inverse frequency weighting - rare symptoms are more diagnostic
             self.symptom_weights[symptom] = max(1.0, total_diseases / disease_count)
     
+    def build_symptom_matcher(self):
+        """Index symptom names and their variations for single-pass extraction."""
+        # Each phrase maps to every standard symptom it implies
+        self.symptom_aliases = {symptom: [symptom] for symptom in self.symptom_map}
+        
+        for standard_symptom, variations in SYMPTOM_VARIATIONS.items():
+            if standard_symptom not in self.symptom_map:
+                continue
+            for variation in variations:
+                implied = self.symptom_aliases.setdefault(variation, [])
+                if standard_symptom not in implied:
+                    implied.append(standard_symptom)
+        
+        self.symptom_matcher = KeywordMatcher(self.symptom_aliases)
+    
+    def build_score_matrix(self):
+        """Build disease x symptom matrices so scoring is a matrix-vector product."""
+        if np is None or not self.symptom_diseases:
+            return
+        
+        self.disease_names = list(self.disease_symptoms)
+        self.symptom_columns = {symptom: column for column, symptom in enumerate(self.symptom_diseases)}
+        
+        # Each cell holds the symptom's weight if the disease lists that symptom
+        score_matrix = np.zeros((len(self.disease_names), len(self.symptom_columns)))
+        for symptom, column in self.symptom_columns.items():
+            weight = self.symptom_weights.get(symptom, 1.0)
+            for disease in self.symptom_diseases[symptom]:
+                score_matrix[self.disease_rank[disease], column] = weight
+        
+        self.score_matrix = score_matrix
+        self.match_matrix = (score_matrix > 0).astype(float)
+        self.disease_lengths = np.array([self.disease_prevalence[d] for d in self.disease_names], dtype=float)
+        
+        # The inverted index flattened into arrays (CSR layout) for the compiled kernel
+        self.column_weights = np.array([self.symptom_weights.get(s, 1.0) for s in self.symptom_columns])
+        self.posting_offsets = np.cumsum(
+            [0] + [len(self.symptom_diseases[s]) for s in self.symptom_columns]
+        ).astype(np.int64)
+        self.posting_rows = np.array(
+            [self.disease_rank[d] for s in self.symptom_columns for d in self.symptom_diseases[s]],
+            dtype=np.int64
+        )
+    
+    def build_question_index(self):
+        """Precompute each disease's follow-up questions, most diagnostic symptom first."""
+        for disease, symptoms in self.disease_symptoms.items():
+            askable = [s for s in dict.fromkeys(symptoms) if s in SYMPTOM_TO_QUESTION]
+            askable.sort(key=lambda s: self.symptom_weights.get(s, 1.0), reverse=True)
+            self.disease_questions[disease] = [(s, SYMPTOM_TO_QUESTION[s]) for s in askable]
+    
     def extract_symptoms_from_text(self, text: str) -> List[str]:
         """Extract symptoms from natural language text."""
-        text = text.lower().strip()
-        found_symptoms = []
-        
-        # Direct matching
-        for symptom in self.symptom_map.keys():
-            if symptom in text:
-                found_symptoms.append(symptom)
-        
-        # Fuzzy matching for common variations
-        symptom_variations = {
-            'headache': ['head pain', 'head ache', 'migraine'],
-            'stomach pain': ['belly pain', 'tummy ache', 'abdominal pain'],
-            'chest pain': ['chest ache', 'heart pain'],
-            'joint pain': ['arthritis pain', 'bone pain'],
-            'muscle pain': ['body ache', 'muscle ache'],
-            'high fever': ['fever', 'temperature', 'hot'],
-            'cough': ['coughing', 'dry cough'],
-            'vomiting': ['throwing up', 'nausea', 'sick'],
-            'diarrhea': ['loose motion', 'loose stool'],
-            'fatigue': ['tired', 'exhausted', 'weakness'],
-            'breathlessness': ['shortness of breath', 'difficulty breathing']
-        }
+        return self._extract_normalized_symptoms(normalize_text(text))
+    
+    def _extract_normalized_symptoms(self, text: str) -> List[str]:
+        """Extract symptoms from already-normalized text."""
+        # Direct and fuzzy matching in a single pass over the text
+        return self._symptoms_from_phrases(self.symptom_matcher.find_all(text))
+    
+    def _symptoms_from_phrases(self, phrases: Iterable[str]) -> List[str]:
+        """Map matched phrases, in vocabulary order, to the symptoms they imply."""
+        # Keys of a dict act as an insertion-ordered set
+        found_symptoms = {}
         
-        for standard_symptom, variations in symptom_variations.items():
-            if standard_symptom not in found_symptoms:
-                for variation in variations:
-                    if variation in text:
-                        if standard_symptom in self.symptom_map:
-                            found_symptoms.append(standard_symptom)
-                        break
+        for phrase in phrases:
+            for symptom in self.symptom_aliases[phrase]:
+                found_symptoms[symptom] = None
         
-        return list(set(found_symptoms))
+        return list(found_symptoms)
     
     def calculate_disease_probability(self, symptoms: List[str]) -> Dict[str, float]:
         """Calculate probability scores for diseases based on symptoms."""
@@ -104,14 +296,8 @@ class AdvancedDiagnosisEngine:
                 disease_scores[primary_disease] += weight
         
         # Also check reverse mapping from disease_symptoms
-        for disease, disease_symptom_list in self.disease_symptoms.items():
-            matched_symptoms = set(symptoms) & set(disease_symptom_list)
-            if matched_symptoms:
-                # Calculate match percentage
-                match_percentage = len(matched_symptoms) / len(disease_symptom_list)
-                # Weight by symptom specificity
-                weighted_score = sum(self.symptom_weights.get(s, 1.0) for s in matched_symptoms)
-                disease_scores[disease] += match_percentage * weighted_score
+        for disease, score in self._score_disease_symptom_matches(set(symptoms)):
+            disease_scores[disease] += score
         
         # Normalize scores
         if disease_scores:
@@ -121,6 +307,48 @@ class AdvancedDiagnosisEngine:
         
         return dict(disease_scores)
     
+    def _score_disease_symptom_matches(self, symptoms: Set[str]) -> List[Tuple[str, float]]:
+        """
+        Score every disease sharing symptoms with the user, in data order.
+        
+        A disease scores its match percentage times the summed weight of
+        the matched symptoms.
+        """
+        if self.score_matrix is not None:
+            columns = [self.symptom_columns[s] for s in symptoms if s in self.symptom_columns]
+            
+            if _accumulate_postings is not None:
+                matched_counts = np.zeros(len(self.disease_names))
+                weighted_scores = np.zeros(len(self.disease_names))
+                _accumulate_postings(
+                    np.array(columns, dtype=np.int64), self.column_weights,
+                    self.posting_offsets, self.posting_rows, matched_counts, weighted_scores
+                )
+            else:
+                query = np.zeros(len(self.symptom_columns))
+                query[columns] = 1.0
+                weighted_scores = self.score_matrix @ query
+                matched_counts = self.match_matrix @ query
+            
+            rows = np.flatnonzero(matched_counts)
+            # Calculate match percentage, weighted by symptom specificity
+            scores = matched_counts[rows] / self.disease_lengths[rows] * weighted_scores[rows]
+            return [(self.disease_names[row], score) for row, score in zip(rows.tolist(), scores.tolist())]
+        
+        matched_counts = {}
+        weighted_scores = {}
+        for symptom in symptoms:
+            weight = self.symptom_weights.get(symptom, 1.0)
+            for disease in self.symptom_diseases.get(symptom, ()):
+                matched_counts[disease] = matched_counts.get(disease, 0) + 1
+                weighted_scores[disease] = weighted_scores.get(disease, 0.0) + weight
+        
+        # Visit diseases in data order so equal scores keep a stable ranking
+        return [
+            (disease, matched_counts[disease] / self.disease_prevalence[disease] * weighted_scores[disease])
+            for disease in sorted(matched_counts, key=self.disease_rank.get)
+        ]
+    
     def get_confidence_level(self, top_score: float, symptom_count: int) -> str:
         """Determine confidence level based on score and symptom count."""
         if top_score >= 0.8 and symptom_count >= 3:
@@ -146,12 +374,12 @@ class AdvancedDiagnosisEngine:
         sorted_diseases = sorted(disease_scores.items(), key=lambda x: x[1], reverse=True)
         
         results = []
+        user_symptom_set = set(symptoms)
         for i, (disease, score) in enumerate(sorted_diseases[:top_n]):
             confidence = self.get_confidence_level(score, len(symptoms))
             
             # Get matching and missing symptoms
-            disease_symptom_set = set(self.disease_symptoms.get(disease, []))
-            user_symptom_set = set(symptoms)
+            disease_symptom_set = self.disease_symptom_sets.get(disease, frozenset())
             
             matching_symptoms = list(disease_symptom_set & user_symptom_set)
             missing_symptoms = list(disease_symptom_set - user_symptom_set)
@@ -170,9 +398,14 @@ class AdvancedDiagnosisEngine:
     
     def advanced_diagnose(self, symptom_text: str) -> Dict:
         """Perform advanced diagnosis with multiple possibilities."""
-        # Extract symptoms
-        symptoms = self.extract_symptoms_from_text(symptom_text)
-        
+        return self._advanced_diagnose_normalized(normalize_text(symptom_text))
+    
+    def _advanced_diagnose_normalized(self, symptom_text: str) -> Dict:
+        """Perform advanced diagnosis on already-normalized text."""
+        return self._diagnose_extracted_symptoms(self._extract_normalized_symptoms(symptom_text))
+    
+    def _diagnose_extracted_symptoms(self, symptoms: List[str]) -> Dict:
+        """Perform advanced diagnosis on symptoms already extracted from text."""
         if not symptoms:
             return {
                 'primary_diagnosis': {
@@ -218,44 +451,16 @@ class AdvancedDiagnosisEngine:
     
     def _get_symptom_suggestions(self) -> List[str]:
         """Get common symptom suggestions."""
-        common_symptoms = [
-            'fever', 'headache', 'cough', 'stomach pain', 'chest pain',
-            'fatigue', 'nausea', 'vomiting', 'diarrhea', 'joint pain',
-            'muscle pain', 'skin rash', 'breathlessness', 'dizziness'
-        ]
-        return [s for s in common_symptoms if s in self.symptom_map]
+        return list(self.symptom_suggestions)
     
     def get_symptom_checker_questions(self, current_symptoms: List[str], suspected_disease: str) -> List[str]:
         """Generate follow-up questions to improve diagnosis accuracy."""
-        if suspected_disease not in self.disease_symptoms:
-            return []
-        
-        disease_symptoms = set(self.disease_symptoms[suspected_disease])
         current_symptom_set = set(current_symptoms)
-        missing_symptoms = disease_symptoms - current_symptom_set
-        
-        # Convert to questions
-        questions = []
-        symptom_to_question = {
-            'high fever': 'Do you have a high fever (over 101°F/38.3°C)?',
-            'chest pain': 'Are you experiencing any chest pain or discomfort?',
-            'breathlessness': 'Do you have difficulty breathing or shortness of breath?',
-            'fatigue': 'Are you feeling unusually tired or fatigued?',
-            'headache': 'Do you have a headache?',
-            'nausea': 'Are you feeling nauseous or sick to your stomach?',
-            'vomiting': 'Have you been vomiting?',
-            'diarrhea': 'Do you have diarrhea or loose stools?',
-            'joint pain': 'Are you experiencing any joint pain?',
-            'muscle pain': 'Do you have muscle aches or pain?',
-            'skin rash': 'Do you have any skin rash or skin changes?',
-            'weight loss': 'Have you experienced unexplained weight loss?',
-            'loss of appetite': 'Have you lost your appetite?',
-            'sweating': 'Are you experiencing excessive sweating?',
-            'dizziness': 'Do you feel dizzy or lightheaded?'
-        }
         
-        for symptom in list(missing_symptoms)[:5]:  # Top 5 questions
-            if symptom in symptom_to_question:
-                questions.append(symptom_to_question[symptom])
+        # Ask about missing symptoms only
+        questions = [
+            question for symptom, question in self.disease_questions.get(suspected_disease, [])
+            if symptom not in current_symptom_set
+        ]
         
-        return questions
\ No newline at end of file
+        return questions[:5]  # Top 5 questions
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Data File Loading
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - the standard library parser is used instead
+    orjson = None
+
+
+def load_json_file(path: str):
+    """
+    Parse a JSON data file, using orjson when it is installed.
+
+    Both parsers raise json.JSONDecodeError (orjson's error subclasses it)
+    on malformed input, so callers can handle either the same way.
+    """
+    with open(path, 'rb') as f:
+        raw_data = f.read()
+    if orjson is not None:
+        return orjson.loads(raw_data)
+    return json.loads(raw_data)
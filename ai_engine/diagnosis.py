@@ -2,20 +2,33 @@
 Core Diagnosis Logic
 """
 
+from collections import Counter
+
+from .keyword_matcher import load_matcher
 from .symptoms import SYMPTOM_MAP
+from .text_normalization import normalize_text
+
+# Compiled matcher tables are kept in the user cache directory between runs
+SYMPTOM_MATCHER_CACHE_NAME = 'symptoms.matcher.pkl'
+
+# Built once so each diagnosis is a single pass over the input text
+SYMPTOM_MATCHER = load_matcher(SYMPTOM_MAP, SYMPTOM_MATCHER_CACHE_NAME)
 
 
 def diagnose(symptom_text: str):
     """
     Diagnose condition based on symptom keywords.
     """
-    symptom_text = symptom_text.lower()
+    return _diagnose_normalized(normalize_text(symptom_text))
 
-    matched_conditions = []
 
-    for symptom, condition in SYMPTOM_MAP.items():
-        if symptom in symptom_text:
-            matched_conditions.append(condition)
+def _diagnose_normalized(symptom_text: str):
+    """
+    Diagnose already-normalized symptom text.
+    """
+    matched_conditions = [
+        SYMPTOM_MAP[symptom] for symptom in SYMPTOM_MATCHER.find_all(symptom_text)
+    ]
 
     if not matched_conditions:
         return {
@@ -24,10 +37,11 @@ def diagnose(symptom_text: str):
             "message": "Symptoms are unclear. Please consult a doctor if they persist."
         }
 
-    # Most frequent condition
-    final_condition = max(set(matched_conditions), key=matched_conditions.count)
+    # Most frequent condition (ties go to the first symptom matched)
+    final_condition, agreeing_symptoms = Counter(matched_conditions).most_common(1)[0]
 
-    confidence = "high" if len(matched_conditions) >= 2 else "medium"
+    # Confidence reflects how many symptoms agree on the chosen condition
+    confidence = "high" if agreeing_symptoms >= 2 else "medium"
 
     return {
         "condition": final_condition,
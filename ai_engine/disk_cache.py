@@ -0,0 +1,88 @@
+"""
+Disk Cache for Derived Data
+Keeps expensive-to-build structures between runs in a per-user cache directory
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Optional
+
+# Pickles are only ever read from the user's own cache directory, never from
+# the package data directory that other users or deploy tools may write to
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'sprout-ai'
+)
+
+
+def cache_key(signature, data_path: Optional[str] = None) -> bytes:
+    """
+    Digest everything a cached value was built from.
+
+    Args:
+        signature: Versions and settings that shape the value; its repr is hashed
+        data_path: Data file the value was derived from, hashed by size and contents
+
+    Returns:
+        A SHA-256 digest that changes whenever any input changes
+    """
+    digest = hashlib.sha256(repr(signature).encode('utf-8'))
+    if data_path is not None:
+        # Contents rather than mtime, which copies and checkouts do not preserve
+        with open(data_path, 'rb') as f:
+            contents = f.read()
+        digest.update(len(contents).to_bytes(8, 'little'))
+        digest.update(contents)
+    return digest.digest()
+
+
+def _is_private(f) -> bool:
+    """Return True if the open file belongs to this user and only they can write it."""
+    if not hasattr(os, 'getuid'):
+        return True
+    status = os.fstat(f.fileno())
+    return status.st_uid == os.getuid() and not status.st_mode & 0o022
+
+
+def load_cached(name: str, key: bytes, cache_dir: Optional[str] = None):
+    """
+    Return the value stored under name, or None if it is missing or stale.
+
+    The key is compared before anything is unpickled, so a cache built from
+    other inputs is never deserialized. cache_dir defaults to CACHE_DIR.
+    """
+    try:
+        with open(os.path.join(cache_dir or CACHE_DIR, name), 'rb') as f:
+            if not _is_private(f) or f.read(len(key)) != key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable caches are simply rebuilt
+        return None
+
+
+def save_cached(name: str, key: bytes, value, cache_dir: Optional[str] = None):
+    """Store value under name for the next run; failures are silently ignored."""
+    # Looked up per call so CACHE_DIR can be redirected, e.g. by tests
+    cache_dir = cache_dir or CACHE_DIR
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    except OSError:
+        # The cache is only an optimization, e.g. the home directory may be read-only
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+            pickle.dump(value, f, protocol=5)
+        os.replace(temp_path, os.path.join(cache_dir, name))
+    except Exception:
+        # Some values cannot be pickled; never leave the partial file behind
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
@@ -3,438 +3,637 @@ Enhanced Natural Remedies System
 Comprehensive remedy database with disease-specific treatments
 """
 
-import json
-import os
-from typing import List, Dict, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .disk_cache import cache_key, load_cached, save_cached
+from .remedies import REMEDY_DATA_PATH, load_remedy_file
+
+# Merged remedy data, reused while REMEDY_DATA_PATH keeps the same contents
+REMEDY_CACHE_NAME = 'remedies.pkl'
+
+# Bump when the cached remedy data changes shape so old caches are rebuilt
+REMEDY_CACHE_VERSION = 2
+
+def _intern_strings(obj):
+    """Return obj with every string interned so repeated values share one object."""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(key): _intern_strings(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_strings(item) for item in obj]
+    return obj
+
+
+class Remedy(NamedTuple):
+    """A single natural remedy; `usage` is missing for some entries in remedies.json."""
+    remedy: str
+    benefit: str
+    explanation: str
+    usage: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, entry: Dict) -> 'Remedy':
+        """Build a remedy from its remedies.json representation."""
+        return cls(entry['remedy'], entry['benefit'], entry['explanation'], entry.get('usage'))
+    
+    def to_dict(self) -> Dict:
+        """Return the dict form callers and the JSON APIs expect."""
+        entry = {'remedy': self.remedy, 'benefit': self.benefit, 'explanation': self.explanation}
+        if self.usage is not None:
+            entry['usage'] = self.usage
+        return entry
+
+
+# Natural remedies for all 41 conditions, merged into the loaded remedy data
+COMPREHENSIVE_REMEDIES = {
+    # Infectious Diseases
+    "fungal infection": [
+        Remedy(
+            remedy="Tea Tree Oil",
+            benefit="Powerful antifungal properties",
+            explanation="Contains terpinen-4-ol which disrupts fungal cell membranes",
+            usage="Dilute 2-3 drops in carrier oil, apply topically 2x daily"
+        ),
+        Remedy(
+            remedy="Apple Cider Vinegar",
+            benefit="Creates acidic environment hostile to fungi",
+            explanation="Acetic acid restores skin pH and inhibits fungal growth",
+            usage="Mix 1:1 with water, apply with cotton ball"
+        ),
+        Remedy(
+            remedy="Coconut Oil",
+            benefit="Natural antifungal and moisturizing",
+            explanation="Lauric acid and caprylic acid have antifungal properties",
+            usage="Apply virgin coconut oil directly to affected area"
+        )
+    ],
+    
+    "viral infection": [
+        Remedy(
+            remedy="Elderberry Syrup",
+            benefit="Boosts immune system and reduces viral load",
+            explanation="Anthocyanins block viral replication and enhance immunity",
+            usage="1 tablespoon 3x daily during illness"
+        ),
+        Remedy(
+            remedy="Ginger Tea",
+            benefit="Anti-inflammatory and immune boosting",
+            explanation="Gingerol compounds reduce inflammation and support immune function",
+            usage="Steep 1 inch fresh ginger in hot water for 10 minutes"
+        ),
+        Remedy(
+            remedy="Echinacea",
+            benefit="Stimulates immune response",
+            explanation="Increases white blood cell activity and cytokine production",
+            usage="300mg standardized extract 3x daily"
+        )
+    ],
+    
+    # Respiratory Conditions
+    "common cold": [
+        Remedy(
+            remedy="Honey and Lemon",
+            benefit="Soothes throat and provides vitamin C",
+            explanation="Honey has antimicrobial properties, lemon provides immune support",
+            usage="Mix 1 tbsp honey with juice of half lemon in warm water"
+        ),
+        Remedy(
+            remedy="Steam Inhalation with Eucalyptus",
+            benefit="Clears nasal congestion",
+            explanation="Eucalyptol opens airways and has antimicrobial effects",
+            usage="Add 3-4 drops eucalyptus oil to bowl of hot water, inhale steam"
+        ),
+        Remedy(
+            remedy="Zinc Lozenges",
+            benefit="Reduces cold duration and severity",
+            explanation="Zinc interferes with viral replication in throat tissues",
+            usage="One 13-23mg lozenge every 2 hours while awake"
+        )
+    ],
+    
+    "bronchial asthma": [
+        Remedy(
+            remedy="Butterbur Extract",
+            benefit="Natural bronchodilator",
+            explanation="Petasins reduce inflammation and relax bronchial muscles",
+            usage="50-75mg standardized extract twice daily"
+        ),
+        Remedy(
+            remedy="Magnesium",
+            benefit="Relaxes airway muscles",
+            explanation="Acts as natural calcium channel blocker, reducing bronchospasm",
+            usage="200-400mg magnesium glycinate daily"
+        ),
+        Remedy(
+            remedy="Quercetin",
+            benefit="Stabilizes mast cells and reduces inflammation",
+            explanation="Flavonoid that prevents histamine release and reduces airway inflammation",
+            usage="500mg twice daily with bromelain for absorption"
+        )
+    ],
+    
+    # Digestive Disorders
+    "gerd": [
+        Remedy(
+            remedy="Aloe Vera Juice",
+            benefit="Soothes esophageal inflammation",
+            explanation="Anti-inflammatory compounds reduce acid irritation",
+            usage="1/4 cup pure aloe juice 20 minutes before meals"
+        ),
+        Remedy(
+            remedy="Slippery Elm",
+            benefit="Coats and protects digestive tract",
+            explanation="Mucilage forms protective barrier against stomach acid",
+            usage="1-2 tsp powder mixed in water before meals"
+        ),
+        Remedy(
+            remedy="D-Limonene",
+            benefit="Promotes gastric motility",
+            explanation="Citrus extract helps stomach empty faster, reducing reflux",
+            usage="1000mg every other day for 20 days"
+        )
+    ],
+    
+    "peptic ulcer diseae": [
+        Remedy(
+            remedy="Manuka Honey",
+            benefit="Antibacterial against H. pylori",
+            explanation="Methylglyoxal kills H. pylori bacteria that cause ulcers",
+            usage="1 tablespoon on empty stomach 3x daily"
+        ),
+        Remedy(
+            remedy="Cabbage Juice",
+            benefit="Heals stomach lining",
+            explanation="Vitamin U (S-methylmethionine) promotes ulcer healing",
+            usage="1/2 cup fresh cabbage juice twice daily"
+        ),
+        Remedy(
+            remedy="Licorice Root (DGL)",
+            benefit="Protects stomach lining",
+            explanation="Increases mucus production and promotes healing",
+            usage="380mg DGL tablets 20 minutes before meals"
+        )
+    ],
+    
+    # Metabolic Conditions
+    "diabetes": [
+        Remedy(
+            remedy="Cinnamon",
+            benefit="Improves insulin sensitivity",
+            explanation="Polyphenols enhance glucose uptake and insulin function",
+            usage="1-2 tsp Ceylon cinnamon daily with meals"
+        ),
+        Remedy(
+            remedy="Bitter Melon",
+            benefit="Natural blood sugar control",
+            explanation="Contains compounds that mimic insulin action",
+            usage="1/2 cup fresh juice or 2g dried extract daily"
+        ),
+        Remedy(
+            remedy="Chromium Picolinate",
+            benefit="Enhances glucose metabolism",
+            explanation="Improves insulin sensitivity and glucose tolerance",
+            usage="200-400mcg daily with meals"
+        )
+    ],
+    
+    "hypothyroidism": [
+        Remedy(
+            remedy="Kelp/Seaweed",
+            benefit="Natural iodine source",
+            explanation="Iodine is essential for thyroid hormone synthesis",
+            usage="150-300mcg iodine from kelp supplements daily"
+        ),
+        Remedy(
+            remedy="Brazil Nuts",
+            benefit="High in selenium",
+            explanation="Selenium required for T4 to T3 conversion",
+            usage="2-3 Brazil nuts daily (provides ~200mcg selenium)"
+        ),
+        Remedy(
+            remedy="Ashwagandha",
+            benefit="Adaptogen supporting thyroid function",
+            explanation="Helps normalize thyroid hormone levels and reduces stress",
+            usage="300-500mg standardized extract twice daily"
+        )
+    ],
+    
+    "hyperthyroidism": [
+        Remedy(
+            remedy="Lemon Balm",
+            benefit="Blocks thyroid stimulating hormone",
+            explanation="Rosmarinic acid inhibits TSH receptor activation",
+            usage="300-500mg extract or 2-3 cups tea daily"
+        ),
+        Remedy(
+            remedy="L-Carnitine",
+            benefit="Reduces hyperthyroid symptoms",
+            explanation="Blocks thyroid hormone action at cellular level",
+            usage="2-4g daily in divided doses"
+        ),
+        Remedy(
+            remedy="Bugleweed",
+            benefit="Reduces thyroid hormone production",
+            explanation="Inhibits thyroid peroxidase enzyme",
+            usage="1-2ml tincture 3x daily (under supervision)"
+        )
+    ],
+    
+    # Cardiovascular
+    "hypertension": [
+        Remedy(
+            remedy="Hibiscus Tea",
+            benefit="Natural ACE inhibitor",
+            explanation="Anthocyanins relax blood vessels and lower pressure",
+            usage="2-3 cups hibiscus tea daily"
+        ),
+        Remedy(
+            remedy="Garlic",
+            benefit="Vasodilator and cardioprotective",
+            explanation="Allicin promotes nitric oxide production, relaxing arteries",
+            usage="600-900mg aged garlic extract daily"
+        ),
+        Remedy(
+            remedy="Hawthorn Berry",
+            benefit="Strengthens heart and improves circulation",
+            explanation="Oligomeric procyanidins support cardiovascular health",
+            usage="160-900mg standardized extract daily"
+        )
+    ],
+    
+    "heart attack": [
+        Remedy(
+            remedy="Immediate Medical Attention",
+            benefit="Life-saving emergency care",
+            explanation="Heart attacks require immediate professional medical intervention",
+            usage="Call 911 immediately - this is a medical emergency"
+        ),
+        Remedy(
+            remedy="Aspirin (if available)",
+            benefit="Blood thinner to reduce clot formation",
+            explanation="Inhibits platelet aggregation during acute event",
+            usage="Chew 325mg aspirin if not allergic (while waiting for emergency care)"
+        )
+    ],
+    
+    # Musculoskeletal
+    "arthritis": [
+        Remedy(
+            remedy="Turmeric with Black Pepper",
+            benefit="Powerful anti-inflammatory",
+            explanation="Curcumin reduces inflammatory cytokines, piperine enhances absorption",
+            usage="500-1000mg curcumin with 5mg piperine daily"
+        ),
+        Remedy(
+            remedy="Fish Oil (Omega-3)",
+            benefit="Reduces joint inflammation",
+            explanation="EPA/DHA decrease inflammatory prostaglandins and leukotrienes",
+            usage="2-3g combined EPA/DHA daily with meals"
+        ),
+        Remedy(
+            remedy="Boswellia",
+            benefit="Natural COX-2 inhibitor",
+            explanation="Boswellic acids block inflammatory enzymes without stomach irritation",
+            usage="300-400mg standardized extract 2-3x daily"
+        )
+    ],
+    
+    # Neurological
+    "migraine": [
+        Remedy(
+            remedy="Feverfew",
+            benefit="Prevents migraine attacks",
+            explanation="Parthenolide reduces inflammation and vascular spasms",
+            usage="100-300mg standardized extract daily for prevention"
+        ),
+        Remedy(
+            remedy="Magnesium Glycinate",
+            benefit="Reduces migraine frequency",
+            explanation="Prevents cortical spreading depression and vascular changes",
+            usage="400-600mg daily for prevention"
+        ),
+        Remedy(
+            remedy="Riboflavin (B2)",
+            benefit="Improves cellular energy metabolism",
+            explanation="Enhances mitochondrial function in brain cells",
+            usage="400mg daily for 3 months minimum"
+        )
+    ]
+}
+
+
+# Immediate actions for critical conditions
+EMERGENCY_CONDITIONS = MappingProxyType({
+    "heart attack": {
+        "immediate_actions": [
+            "Call 911 immediately",
+            "Chew aspirin if available and not allergic",
+            "Sit down and rest",
+            "Loosen tight clothing"
+        ],
+        "warning": "This is a life-threatening emergency requiring immediate medical attention"
+    },
+    "paralysis (brain hemorrhage)": {
+        "immediate_actions": [
+            "Call 911 immediately",
+            "Do not give food or water",
+            "Keep person calm and still",
+            "Note time symptoms started"
+        ],
+        "warning": "Brain hemorrhage requires immediate emergency medical care"
+    },
+    "hepatitis e": {
+        "immediate_actions": [
+            "Seek immediate medical attention",
+            "Avoid alcohol completely",
+            "Stay hydrated with clear fluids",
+            "Rest and avoid strenuous activity"
+        ],
+        "warning": "Acute liver failure can be life-threatening"
+    }
+})
+
+
+# Lifestyle changes that help manage chronic conditions
+LIFESTYLE_RECOMMENDATIONS = MappingProxyType({
+    "diabetes": [
+        "Follow a low-glycemic diet",
+        "Exercise regularly (150 minutes/week)",
+        "Monitor blood sugar levels",
+        "Maintain healthy weight",
+        "Stay hydrated",
+        "Get adequate sleep (7-9 hours)"
+    ],
+    "hypertension": [
+        "Reduce sodium intake (<2300mg/day)",
+        "Increase potassium-rich foods",
+        "Maintain healthy weight",
+        "Exercise regularly",
+        "Limit alcohol consumption",
+        "Manage stress through meditation/yoga",
+        "Quit smoking"
+    ],
+    "arthritis": [
+        "Maintain healthy weight",
+        "Low-impact exercise (swimming, walking)",
+        "Apply heat/cold therapy",
+        "Practice gentle stretching",
+        "Use ergonomic tools",
+        "Get adequate sleep"
+    ],
+    "gerd": [
+        "Eat smaller, frequent meals",
+        "Avoid trigger foods (spicy, acidic, fatty)",
+        "Don't lie down after eating",
+        "Elevate head of bed",
+        "Maintain healthy weight",
+        "Quit smoking",
+        "Limit alcohol and caffeine"
+    ]
+})
+
+
+# Foods to favour and avoid for chronic conditions
+DIETARY_RECOMMENDATIONS = MappingProxyType({
+    "diabetes": {
+        "foods_to_include": [
+            "Leafy greens", "Fatty fish", "Nuts and seeds", 
+            "Berries", "Sweet potatoes", "Legumes"
+        ],
+        "foods_to_avoid": [
+            "Refined sugars", "White bread", "Processed foods",
+            "Sugary drinks", "Trans fats"
+        ]
+    },
+    "hypertension": {
+        "foods_to_include": [
+            "Bananas", "Leafy greens", "Berries", "Beets",
+            "Oats", "Garlic", "Dark chocolate"
+        ],
+        "foods_to_avoid": [
+            "High sodium foods", "Processed meats", "Canned soups",
+            "Fast food", "Alcohol in excess"
+        ]
+    },
+    "arthritis": {
+        "foods_to_include": [
+            "Fatty fish", "Leafy greens", "Berries", "Cherries",
+            "Olive oil", "Nuts", "Turmeric"
+        ],
+        "foods_to_avoid": [
+            "Processed foods", "Refined sugars", "Trans fats",
+            "Excessive omega-6 oils"
+        ]
+    }
+})
+
+
+class ConditionRecord(NamedTuple):
+    """Everything known about one condition, precomputed for get_condition_info."""
+    remedies: Tuple[Dict, ...]
+    precautions: Tuple[str, ...]
+    lifestyle: Tuple[str, ...]
+    diet: Dict
+    emergency: Dict
+
+
+# Shared result for conditions without remedies or precautions
+_EMPTY = ()
+
+# Record for conditions that appear in none of the tables
+EMPTY_CONDITION_RECORD = ConditionRecord(_EMPTY, _EMPTY, _EMPTY, {}, {})
+
 
 class EnhancedRemedySystem:
     """Enhanced remedy system with comprehensive natural treatments."""
     
+    __slots__ = ('remedy_database', 'precautions_database', 'condition_table')
+    
     def __init__(self):
         self.remedy_database = {}
         self.precautions_database = {}
-        self.load_remedy_data()
-        self.initialize_comprehensive_remedies()
+        if not self.load_cached_state():
+            self.load_remedy_data()
+            self.initialize_comprehensive_remedies()
+            self.save_cached_state()
+        self.build_condition_table()
     
     def load_remedy_data(self):
         """Load existing remedy data."""
         try:
-            data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'remedies.json')
-            with open(data_path, 'r') as f:
-                data = json.load(f)
+            # Precautions and remedy fields repeat across conditions
+            data = _intern_strings(load_remedy_file())
             
-            self.remedy_database = data.get('remedy_database', {})
-            self.precautions_database = data.get('disease_precautions', {})
+            # Keys are lowercased once here so lookups only lower the query
+            self.remedy_database = {
+                disease.lower(): [Remedy.from_dict(entry) for entry in remedies]
+                for disease, remedies in data.get('remedy_database', {}).items()
+            }
+            self.precautions_database = {
+                disease.lower(): precautions
+                for disease, precautions in data.get('disease_precautions', {}).items()
+            }
             
         except Exception as e:
             print(f"Error loading remedy data: {e}")
     
+    def _cache_signature(self) -> Tuple:
+        """Describe everything besides the data file that shapes the cached state."""
+        return (REMEDY_CACHE_VERSION, COMPREHENSIVE_REMEDIES)
+    
+    def load_cached_state(self) -> bool:
+        """Restore previously merged remedy data if its cache is still current."""
+        try:
+            key = cache_key(self._cache_signature(), REMEDY_DATA_PATH)
+        except OSError:
+            return False
+        cached = load_cached(REMEDY_CACHE_NAME, key)
+        if cached is None:
+            return False
+        
+        self.remedy_database, self.precautions_database = cached
+        return True
+    
+    def save_cached_state(self):
+        """Store the merged remedy data in the user cache directory for the next start-up."""
+        if not self.precautions_database:
+            return
+        
+        try:
+            key = cache_key(self._cache_signature(), REMEDY_DATA_PATH)
+        except OSError:
+            return
+        save_cached(REMEDY_CACHE_NAME, key, (self.remedy_database, self.precautions_database))
+    
     def initialize_comprehensive_remedies(self):
         """Initialize comprehensive remedy database for all 41 conditions."""
-        
-        comprehensive_remedies = {
-            # Infectious Diseases
-            "fungal infection": [
-                {
-                    "remedy": "Tea Tree Oil",
-                    "benefit": "Powerful antifungal properties",
-                    "explanation": "Contains terpinen-4-ol which disrupts fungal cell membranes",
-                    "usage": "Dilute 2-3 drops in carrier oil, apply topically 2x daily"
-                },
-                {
-                    "remedy": "Apple Cider Vinegar",
-                    "benefit": "Creates acidic environment hostile to fungi",
-                    "explanation": "Acetic acid restores skin pH and inhibits fungal growth",
-                    "usage": "Mix 1:1 with water, apply with cotton ball"
-                },
-                {
-                    "remedy": "Coconut Oil",
-                    "benefit": "Natural antifungal and moisturizing",
-                    "explanation": "Lauric acid and caprylic acid have antifungal properties",
-                    "usage": "Apply virgin coconut oil directly to affected area"
-                }
-            ],
-            
-            "viral infection": [
-                {
-                    "remedy": "Elderberry Syrup",
-                    "benefit": "Boosts immune system and reduces viral load",
-                    "explanation": "Anthocyanins block viral replication and enhance immunity",
-                    "usage": "1 tablespoon 3x daily during illness"
-                },
-                {
-                    "remedy": "Ginger Tea",
-                    "benefit": "Anti-inflammatory and immune boosting",
-                    "explanation": "Gingerol compounds reduce inflammation and support immune function",
-                    "usage": "Steep 1 inch fresh ginger in hot water for 10 minutes"
-                },
-                {
-                    "remedy": "Echinacea",
-                    "benefit": "Stimulates immune response",
-                    "explanation": "Increases white blood cell activity and cytokine production",
-                    "usage": "300mg standardized extract 3x daily"
-                }
-            ],
-            
-            # Respiratory Conditions
-            "common cold": [
-                {
-                    "remedy": "Honey and Lemon",
-                    "benefit": "Soothes throat and provides vitamin C",
-                    "explanation": "Honey has antimicrobial properties, lemon provides immune support",
-                    "usage": "Mix 1 tbsp honey with juice of half lemon in warm water"
-                },
-                {
-                    "remedy": "Steam Inhalation with Eucalyptus",
-                    "benefit": "Clears nasal congestion",
-                    "explanation": "Eucalyptol opens airways and has antimicrobial effects",
-                    "usage": "Add 3-4 drops eucalyptus oil to bowl of hot water, inhale steam"
-                },
-                {
-                    "remedy": "Zinc Lozenges",
-                    "benefit": "Reduces cold duration and severity",
-                    "explanation": "Zinc interferes with viral replication in throat tissues",
-                    "usage": "One 13-23mg lozenge every 2 hours while awake"
-                }
-            ],
-            
-            "bronchial asthma": [
-                {
-                    "remedy": "Butterbur Extract",
-                    "benefit": "Natural bronchodilator",
-                    "explanation": "Petasins reduce inflammation and relax bronchial muscles",
-                    "usage": "50-75mg standardized extract twice daily"
-                },
-                {
-                    "remedy": "Magnesium",
-                    "benefit": "Relaxes airway muscles",
-                    "explanation": "Acts as natural calcium channel blocker, reducing bronchospasm",
-                    "usage": "200-400mg magnesium glycinate daily"
-                },
-                {
-                    "remedy": "Quercetin",
-                    "benefit": "Stabilizes mast cells and reduces inflammation",
-                    "explanation": "Flavonoid that prevents histamine release and reduces airway inflammation",
-                    "usage": "500mg twice daily with bromelain for absorption"
-                }
-            ],
-            
-            # Digestive Disorders
-            "gerd": [
-                {
-                    "remedy": "Aloe Vera Juice",
-                    "benefit": "Soothes esophageal inflammation",
-                    "explanation": "Anti-inflammatory compounds reduce acid irritation",
-                    "usage": "1/4 cup pure aloe juice 20 minutes before meals"
-                },
-                {
-                    "remedy": "Slippery Elm",
-                    "benefit": "Coats and protects digestive tract",
-                    "explanation": "Mucilage forms protective barrier against stomach acid",
-                    "usage": "1-2 tsp powder mixed in water before meals"
-                },
-                {
-                    "remedy": "D-Limonene",
-                    "benefit": "Promotes gastric motility",
-                    "explanation": "Citrus extract helps stomach empty faster, reducing reflux",
-                    "usage": "1000mg every other day for 20 days"
-                }
-            ],
-            
-            "peptic ulcer diseae": [
-                {
-                    "remedy": "Manuka Honey",
-                    "benefit": "Antibacterial against H. pylori",
-                    "explanation": "Methylglyoxal kills H. pylori bacteria that cause ulcers",
-                    "usage": "1 tablespoon on empty stomach 3x daily"
-                },
-                {
-                    "remedy": "Cabbage Juice",
-                    "benefit": "Heals stomach lining",
-                    "explanation": "Vitamin U (S-methylmethionine) promotes ulcer healing",
-                    "usage": "1/2 cup fresh cabbage juice twice daily"
-                },
-                {
-                    "remedy": "Licorice Root (DGL)",
-                    "benefit": "Protects stomach lining",
-                    "explanation": "Increases mucus production and promotes healing",
-                    "usage": "380mg DGL tablets 20 minutes before meals"
-                }
-            ],
-            
-            # Metabolic Conditions
-            "diabetes": [
-                {
-                    "remedy": "Cinnamon",
-                    "benefit": "Improves insulin sensitivity",
-                    "explanation": "Polyphenols enhance glucose uptake and insulin function",
-                    "usage": "1-2 tsp Ceylon cinnamon daily with meals"
-                },
-                {
-                    "remedy": "Bitter Melon",
-                    "benefit": "Natural blood sugar control",
-                    "explanation": "Contains compounds that mimic insulin action",
-                    "usage": "1/2 cup fresh juice or 2g dried extract daily"
-                },
-                {
-                    "remedy": "Chromium Picolinate",
-                    "benefit": "Enhances glucose metabolism",
-                    "explanation": "Improves insulin sensitivity and glucose tolerance",
-                    "usage": "200-400mcg daily with meals"
-                }
-            ],
-            
-            "hypothyroidism": [
-                {
-                    "remedy": "Kelp/Seaweed",
-                    "benefit": "Natural iodine source",
-                    "explanation": "Iodine is essential for thyroid hormone synthesis",
-                    "usage": "150-300mcg iodine from kelp supplements daily"
-                },
-                {
-                    "remedy": "Brazil Nuts",
-                    "benefit": "High in selenium",
-                    "explanation": "Selenium required for T4 to T3 conversion",
-                    "usage": "2-3 Brazil nuts daily (provides ~200mcg selenium)"
-                },
-                {
-                    "remedy": "Ashwagandha",
-                    "benefit": "Adaptogen supporting thyroid function",
-                    "explanation": "Helps normalize thyroid hormone levels and reduces stress",
-                    "usage": "300-500mg standardized extract twice daily"
-                }
-            ],
-            
-            "hyperthyroidism": [
-                {
-                    "remedy": "Lemon Balm",
-                    "benefit": "Blocks thyroid stimulating hormone",
-                    "explanation": "Rosmarinic acid inhibits TSH receptor activation",
-                    "usage": "300-500mg extract or 2-3 cups tea daily"
-                },
-                {
-                    "remedy": "L-Carnitine",
-                    "benefit": "Reduces hyperthyroid symptoms",
-                    "explanation": "Blocks thyroid hormone action at cellular level",
-                    "usage": "2-4g daily in divided doses"
-                },
-                {
-                    "remedy": "Bugleweed",
-                    "benefit": "Reduces thyroid hormone production",
-                    "explanation": "Inhibits thyroid peroxidase enzyme",
-                    "usage": "1-2ml tincture 3x daily (under supervision)"
-                }
-            ],
-            
-            # Cardiovascular
-            "hypertension": [
-                {
-                    "remedy": "Hibiscus Tea",
-                    "benefit": "Natural ACE inhibitor",
-                    "explanation": "Anthocyanins relax blood vessels and lower pressure",
-                    "usage": "2-3 cups hibiscus tea daily"
-                },
-                {
-                    "remedy": "Garlic",
-                    "benefit": "Vasodilator and cardioprotective",
-                    "explanation": "Allicin promotes nitric oxide production, relaxing arteries",
-                    "usage": "600-900mg aged garlic extract daily"
-                },
-                {
-                    "remedy": "Hawthorn Berry",
-                    "benefit": "Strengthens heart and improves circulation",
-                    "explanation": "Oligomeric procyanidins support cardiovascular health",
-                    "usage": "160-900mg standardized extract daily"
-                }
-            ],
-            
-            "heart attack": [
-                {
-                    "remedy": "Immediate Medical Attention",
-                    "benefit": "Life-saving emergency care",
-                    "explanation": "Heart attacks require immediate professional medical intervention",
-                    "usage": "Call 911 immediately - this is a medical emergency"
-                },
-                {
-                    "remedy": "Aspirin (if available)",
-                    "benefit": "Blood thinner to reduce clot formation",
-                    "explanation": "Inhibits platelet aggregation during acute event",
-                    "usage": "Chew 325mg aspirin if not allergic (while waiting for emergency care)"
-                }
-            ],
-            
-            # Musculoskeletal
-            "arthritis": [
-                {
-                    "remedy": "Turmeric with Black Pepper",
-                    "benefit": "Powerful anti-inflammatory",
-                    "explanation": "Curcumin reduces inflammatory cytokines, piperine enhances absorption",
-                    "usage": "500-1000mg curcumin with 5mg piperine daily"
-                },
-                {
-                    "remedy": "Fish Oil (Omega-3)",
-                    "benefit": "Reduces joint inflammation",
-                    "explanation": "EPA/DHA decrease inflammatory prostaglandins and leukotrienes",
-                    "usage": "2-3g combined EPA/DHA daily with meals"
-                },
-                {
-                    "remedy": "Boswellia",
-                    "benefit": "Natural COX-2 inhibitor",
-                    "explanation": "Boswellic acids block inflammatory enzymes without stomach irritation",
-                    "usage": "300-400mg standardized extract 2-3x daily"
-                }
-            ],
+        # Merge with existing remedies
+        for disease, remedies in COMPREHENSIVE_REMEDIES.items():
+            existing_remedies = self.remedy_database.get(disease)
+            if existing_remedies is None:
+                self.remedy_database[disease] = list(remedies)
+                continue
             
-            # Neurological
-            "migraine": [
-                {
-                    "remedy": "Feverfew",
-                    "benefit": "Prevents migraine attacks",
-                    "explanation": "Parthenolide reduces inflammation and vascular spasms",
-                    "usage": "100-300mg standardized extract daily for prevention"
-                },
-                {
-                    "remedy": "Magnesium Glycinate",
-                    "benefit": "Reduces migraine frequency",
-                    "explanation": "Prevents cortical spreading depression and vascular changes",
-                    "usage": "400-600mg daily for prevention"
-                },
-                {
-                    "remedy": "Riboflavin (B2)",
-                    "benefit": "Improves cellular energy metabolism",
-                    "explanation": "Enhances mitochondrial function in brain cells",
-                    "usage": "400mg daily for 3 months minimum"
-                }
-            ]
-        }
+            # Add new remedies to existing ones
+            existing_remedy_names = {r.remedy for r in existing_remedies}
+            existing_remedies.extend(
+                remedy for remedy in remedies if remedy.remedy not in existing_remedy_names
+            )
+    
+    def build_condition_table(self):
+        """
+        Combine every per-condition table into one record per condition.
         
-        # Merge with existing remedies
-        for disease, remedies in comprehensive_remedies.items():
-            if disease not in self.remedy_database:
-                self.remedy_database[disease] = remedies
-            else:
-                # Add new remedies to existing ones
-                existing_remedy_names = {r['remedy'] for r in self.remedy_database[disease]}
-                for remedy in remedies:
-                    if remedy['remedy'] not in existing_remedy_names:
-                        self.remedy_database[disease].append(remedy)
+        Call again after changing remedy_database or precautions_database.
+        """
+        conditions = dict.fromkeys(self.remedy_database)
+        for table in (self.precautions_database, LIFESTYLE_RECOMMENDATIONS,
+                      DIETARY_RECOMMENDATIONS, EMERGENCY_CONDITIONS):
+            conditions.update(dict.fromkeys(table))
+        
+        self.condition_table = {
+            condition: ConditionRecord(
+                remedies=tuple(remedy.to_dict() for remedy in self.remedy_database.get(condition, ())),
+                precautions=tuple(self.precautions_database.get(condition, ())),
+                lifestyle=tuple(LIFESTYLE_RECOMMENDATIONS.get(condition, ())),
+                diet=DIETARY_RECOMMENDATIONS.get(condition, {}),
+                emergency=EMERGENCY_CONDITIONS.get(condition, {})
+            )
+            for condition in conditions
+        }
     
-    def get_remedies(self, condition: str) -> List[Dict]:
+    def get_remedies(self, condition: str) -> Sequence[Dict]:
         """Get remedies for a specific condition."""
-        return self.remedy_database.get(condition.lower(), [])
+        record = self.condition_table.get(condition.lower(), EMPTY_CONDITION_RECORD)
+        if not record.remedies:
+            return _EMPTY
+        # The dict form is built once per condition; callers get copies of it
+        return tuple([dict(remedy) for remedy in record.remedies])
     
-    def get_precautions(self, condition: str) -> List[str]:
+    def get_precautions(self, condition: str) -> Sequence[str]:
         """Get precautions for a specific condition."""
-        return self.precautions_database.get(condition.lower(), [])
+        # Precautions are immutable strings, so the stored tuple is shared as is
+        return self.condition_table.get(condition.lower(), EMPTY_CONDITION_RECORD).precautions
+    
+    def get_condition_info(self, condition: str) -> MappingProxyType:
+        """
+        Get everything known about a condition with a single lookup.
+        
+        Args:
+            condition (str): Condition name in any case
+            
+        Returns:
+            MappingProxyType: Read-only bundle with 'remedies', 'precautions',
+            'lifestyle', 'diet' and 'emergency' entries, each a fresh copy
+        """
+        record = self.condition_table.get(condition.lower(), EMPTY_CONDITION_RECORD)
+        # The table is shared, so callers get their own copies of its entries
+        return MappingProxyType({
+            'remedies': [dict(remedy) for remedy in record.remedies],
+            'precautions': list(record.precautions),
+            'lifestyle': list(record.lifestyle),
+            'diet': _copy_entry(record.diet),
+            'emergency': _copy_entry(record.emergency)
+        })
     
     def get_emergency_remedies(self, condition: str) -> Dict:
         """Get emergency remedies for critical conditions."""
-        emergency_conditions = {
-            "heart attack": {
-                "immediate_actions": [
-                    "Call 911 immediately",
-                    "Chew aspirin if available and not allergic",
-                    "Sit down and rest",
-                    "Loosen tight clothing"
-                ],
-                "warning": "This is a life-threatening emergency requiring immediate medical attention"
-            },
-            "paralysis (brain hemorrhage)": {
-                "immediate_actions": [
-                    "Call 911 immediately",
-                    "Do not give food or water",
-                    "Keep person calm and still",
-                    "Note time symptoms started"
-                ],
-                "warning": "Brain hemorrhage requires immediate emergency medical care"
-            },
-            "hepatitis e": {
-                "immediate_actions": [
-                    "Seek immediate medical attention",
-                    "Avoid alcohol completely",
-                    "Stay hydrated with clear fluids",
-                    "Rest and avoid strenuous activity"
-                ],
-                "warning": "Acute liver failure can be life-threatening"
-            }
-        }
-        
-        return emergency_conditions.get(condition.lower(), {})
+        return get_emergency_remedies(condition)
     
     def get_lifestyle_recommendations(self, condition: str) -> List[str]:
         """Get lifestyle recommendations for managing conditions."""
-        lifestyle_recommendations = {
-            "diabetes": [
-                "Follow a low-glycemic diet",
-                "Exercise regularly (150 minutes/week)",
-                "Monitor blood sugar levels",
-                "Maintain healthy weight",
-                "Stay hydrated",
-                "Get adequate sleep (7-9 hours)"
-            ],
-            "hypertension": [
-                "Reduce sodium intake (<2300mg/day)",
-                "Increase potassium-rich foods",
-                "Maintain healthy weight",
-                "Exercise regularly",
-                "Limit alcohol consumption",
-                "Manage stress through meditation/yoga",
-                "Quit smoking"
-            ],
-            "arthritis": [
-                "Maintain healthy weight",
-                "Low-impact exercise (swimming, walking)",
-                "Apply heat/cold therapy",
-                "Practice gentle stretching",
-                "Use ergonomic tools",
-                "Get adequate sleep"
-            ],
-            "gerd": [
-                "Eat smaller, frequent meals",
-                "Avoid trigger foods (spicy, acidic, fatty)",
-                "Don't lie down after eating",
-                "Elevate head of bed",
-                "Maintain healthy weight",
-                "Quit smoking",
-                "Limit alcohol and caffeine"
-            ]
-        }
-        
-        return lifestyle_recommendations.get(condition.lower(), [])
+        return get_lifestyle_recommendations(condition)
     
     def get_dietary_recommendations(self, condition: str) -> Dict:
         """Get specific dietary recommendations."""
-        dietary_recommendations = {
-            "diabetes": {
-                "foods_to_include": [
-                    "Leafy greens", "Fatty fish", "Nuts and seeds", 
-                    "Berries", "Sweet potatoes", "Legumes"
-                ],
-                "foods_to_avoid": [
-                    "Refined sugars", "White bread", "Processed foods",
-                    "Sugary drinks", "Trans fats"
-                ]
-            },
-            "hypertension": {
-                "foods_to_include": [
-                    "Bananas", "Leafy greens", "Berries", "Beets",
-                    "Oats", "Garlic", "Dark chocolate"
-                ],
-                "foods_to_avoid": [
-                    "High sodium foods", "Processed meats", "Canned soups",
-                    "Fast food", "Alcohol in excess"
-                ]
-            },
-            "arthritis": {
-                "foods_to_include": [
-                    "Fatty fish", "Leafy greens", "Berries", "Cherries",
-                    "Olive oil", "Nuts", "Turmeric"
-                ],
-                "foods_to_avoid": [
-                    "Processed foods", "Refined sugars", "Trans fats",
-                    "Excessive omega-6 oils"
-                ]
-            }
-        }
-        
-        return dietary_recommendations.get(condition.lower(), {})
\ No newline at end of file
+        return get_dietary_recommendations(condition)
+
+
+@lru_cache(maxsize=None)
+def get_remedy_system() -> EnhancedRemedySystem:
+    """Return the process-wide remedy system, loading remedy data on first use."""
+    return EnhancedRemedySystem()
+
+
+def get_remedies(condition: str) -> Sequence[Dict]:
+    """Get remedies for a specific condition from the shared remedy system."""
+    return get_remedy_system().get_remedies(condition)
+
+
+def get_precautions(condition: str) -> Sequence[str]:
+    """Get precautions for a specific condition from the shared remedy system."""
+    return get_remedy_system().get_precautions(condition)
+
+
+def get_condition_info(condition: str) -> MappingProxyType:
+    """Get the combined remedy bundle for a condition from the shared remedy system."""
+    return get_remedy_system().get_condition_info(condition)
+
+
+# The tables below are static, so they are read without loading remedies.json.
+# Lookups are a single dict access; callers get copies so the tables stay intact.
+
+def _copy_entry(entry: Dict) -> Dict:
+    """Return a copy of a table entry whose list values callers may modify."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in entry.items()}
+
+
+def get_emergency_remedies(condition: str) -> Dict:
+    """Get emergency remedies for critical conditions."""
+    entry = EMERGENCY_CONDITIONS.get(condition.lower())
+    return {} if entry is None else _copy_entry(entry)
+
+
+def get_lifestyle_recommendations(condition: str) -> List[str]:
+    """Get lifestyle recommendations for managing conditions."""
+    return list(LIFESTYLE_RECOMMENDATIONS.get(condition.lower(), ()))
+
+
+def get_dietary_recommendations(condition: str) -> Dict:
+    """Get specific dietary recommendations."""
+    entry = DIETARY_RECOMMENDATIONS.get(condition.lower())
+    return {} if entry is None else _copy_entry(entry)
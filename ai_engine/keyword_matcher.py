@@ -0,0 +1,170 @@
+"""
+Multi-keyword Substring Matching
+Finds every known keyword in a text with a single pass when possible
+"""
+
+import re
+import threading
+from typing import Iterable, List, Optional
+
+from .disk_cache import cache_key, load_cached, save_cached
+
+try:
+    import hyperscan
+except ImportError:
+    # Hyperscan is optional - the Aho-Corasick or plain scan is used instead
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional - fall back to plain substring checks
+    ahocorasick = None
+
+# Below this many keywords, plain substring checks beat an automaton's per-call
+# overhead (measured with pyahocorasick on typical symptom sentences)
+MIN_AUTOMATON_KEYWORDS = 32
+
+
+def available_backend() -> str:
+    """Name the fastest matching backend installed in this environment."""
+    if hyperscan is not None:
+        return 'hyperscan'
+    if ahocorasick is not None:
+        return 'ahocorasick'
+    return 'scan'
+
+
+class KeywordMatcher:
+    """Match a fixed vocabulary of keywords against free text."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._database = None
+        self._automaton = None
+        self._local = threading.local()
+
+        if len(self.keywords) < MIN_AUTOMATON_KEYWORDS:
+            return
+
+        if hyperscan is not None:
+            self._database = self._compile_database(self.keywords)
+        elif ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(self.keywords):
+                automaton.add_word(keyword, index)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @staticmethod
+    def _compile_database(keywords: List[str]):
+        """Compile keywords as literal patterns into a Hyperscan block database."""
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(keyword).encode('utf-8') for keyword in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            # Each keyword only needs to be reported once per scan
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(keywords)
+        )
+        return database
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Per-thread scratch space is recreated on demand after unpickling
+        del state['_local']
+        if self._database is not None:
+            state['_database'] = hyperscan.dumpb(self._database)
+        return state
+
+    def __setstate__(self, state):
+        if state['_database'] is not None:
+            state['_database'] = hyperscan.loadb(state['_database'], hyperscan.HS_MODE_BLOCK)
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _scratch(self):
+        """Return this thread's Hyperscan scratch space."""
+        # Scratch space must not be shared between concurrent scans
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        return scratch
+
+    def _scan(self, text: str) -> set:
+        """Scan text with the Hyperscan database and return matched indices."""
+        found = set()
+        self._database.scan(
+            text.encode('utf-8'),
+            match_event_handler=lambda index, *_: found.add(index),
+            scratch=self._scratch()
+        )
+        return found
+
+    def contains_any(self, text: str) -> bool:
+        """Return True if any keyword occurs in text, stopping at the first match."""
+        if self._database is not None:
+            try:
+                # Returning True from the handler halts the scan
+                self._database.scan(
+                    text.encode('utf-8'),
+                    match_event_handler=lambda *_: True,
+                    scratch=self._scratch()
+                )
+            except hyperscan.ScanTerminated:
+                return True
+            return False
+
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+
+        for keyword in self.keywords:
+            if keyword in text:
+                return True
+        return False
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        Return the keywords contained in text.
+
+        Keywords are returned once each, in vocabulary order, exactly as
+        `[k for k in keywords if k in text]` would return them.
+        """
+        if self._database is not None:
+            found = self._scan(text)
+        elif self._automaton is not None:
+            found = {index for _, index in self._automaton.iter(text)}
+        else:
+            return [keyword for keyword in self.keywords if keyword in text]
+
+        return [self.keywords[index] for index in sorted(found)]
+
+
+def load_matcher(keywords: Iterable[str], cache_name: str, cache_dir: Optional[str] = None) -> KeywordMatcher:
+    """
+    Build a KeywordMatcher, reusing the compiled tables cached under cache_name.
+
+    Compiling a Hyperscan database costs milliseconds on every start-up while
+    loading a serialized one is nearly free, so the result is kept on disk.
+
+    Args:
+        keywords: Vocabulary to match
+        cache_name: File name of the cached matcher inside cache_dir
+        cache_dir: Directory holding cached matchers, CACHE_DIR by default
+
+    Returns:
+        A matcher for exactly these keywords
+    """
+    keywords = list(dict.fromkeys(keywords))
+    # A cache built for another vocabulary or backend is never unpickled
+    key = cache_key((available_backend(), keywords))
+    matcher = load_cached(cache_name, key, cache_dir)
+    if matcher is not None:
+        return matcher
+
+    matcher = KeywordMatcher(keywords)
+    if matcher._database is not None or matcher._automaton is not None:
+        save_cached(cache_name, key, matcher, cache_dir)
+    return matcher
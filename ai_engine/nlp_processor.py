@@ -4,7 +4,128 @@ Enhanced conversational understanding like ChatGPT
 """
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Tuple
+from .diagnosis import SYMPTOM_MATCHER
+from .keyword_matcher import KeywordMatcher
+from .symptoms import SYMPTOM_MAP
+from .text_normalization import normalize_text
+
+try:
+    import re2
+except ImportError:
+    # google-re2 is optional - long inputs use the backtracking re engine instead
+    re2 = None
+
+# Short phrases like "headache" or "fever" repeat constantly across users
+PROCESS_CACHE_SIZE = 4096
+
+# Fallback patterns for pulling symptom phrases out of free text
+SYMPTOM_PATTERN_SOURCES = (
+    r"i have (?:a |an |some |really |very |quite |pretty |)?(?:bad |severe |terrible |awful |mild |slight |little |minor |)?(.*?)(?:\s+and|\s*,|\s*$|\s+that|\s+which)",
+    r"i'm feeling (.*?)(?:\s+and|\s*,|\s*$)",
+    r"experiencing (.*?)(?:\s+and|\s*,|\s*$)",
+    r"my (.*?) (?:hurts?|aches?|is sore|feels? bad|feels? terrible|really hurts?)",
+    r"(headache|fever|nausea|vomiting|cough|pain|ache|sick|hurt|hurts)",
+    r"feeling (nauseous|sick|dizzy|tired|weak|feverish)",
+    r"(itching|burning|throbbing|sharp|dull) (?:pain|sensation|feeling)",
+    r"(?:really |very |quite |)?(sick|nauseous|hurt|pain|ache|fever|headache|cough)",
+    r"stomach (?:really |very |)?(?:hurts?|aches?|pain)",
+    r"feel (?:really |very |)?sick"
+)
+
+SYMPTOM_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in SYMPTOM_PATTERN_SOURCES]
+
+# Inputs at least this long are matched with RE2, whose run time is linear in
+# the text length; the lazy `(.*?)` groups can backtrack quadratically in re
+LONG_TEXT_LENGTH = 500
+
+LINEAR_SYMPTOM_PATTERNS = (
+    [re2.compile("(?i)" + pattern) for pattern in SYMPTOM_PATTERN_SOURCES]
+    if re2 is not None else None
+)
+
+
+# Known symptom names in SYMPTOM_MAP order, for scans that only need the names
+SYMPTOM_KEYS = tuple(SYMPTOM_MAP)
+
+GREETINGS = ("hello", "hi", "hey", "good morning", "good afternoon", "good evening")
+
+# Inputs mentioning these are never treated as greetings
+GREETING_EMERGENCY_KEYWORDS = (
+    "chest pain", "difficulty breathing", "severe bleeding", "unconscious", "seizure"
+)
+
+SYSTEM_QUESTIONS = (
+    "what can you do", "how do you work", "what are you",
+    "help me", "what is this", "how does this work"
+)
+
+# Words dropped from extracted symptom phrases
+FILLER_WORDS = frozenset(["a", "an", "the", "some", "really", "very", "quite", "pretty", "kind of"])
+
+# Fragments of extracted phrases and the known symptoms they stand for
+SYMPTOM_MAPPINGS = {
+    "headache": ["headache"],
+    "head pain": ["headache"],
+    "nauseous": ["vomiting"],
+    "sick": ["vomiting"],
+    "queasy": ["vomiting"],
+    "stomach": ["stomach pain"],
+    "belly": ["stomach pain"],
+    "tummy": ["stomach pain"],
+    "throat": ["sore throat"],
+    "nose": ["runny nose"],
+    "stuffy": ["runny nose"],
+    "congested": ["runny nose"],
+    "temperature": ["fever"],
+    "hot": ["fever"],
+    "chills": ["fever"],
+    "shivering": ["fever"],
+    "ache": ["body pain"],
+    "aches": ["body pain"],
+    "tired": ["fatigue"],
+    "exhausted": ["fatigue"],
+    "weak": ["fatigue"],
+    "rash": ["skin rash"],
+    "itchy": ["itching"],
+    "scratchy": ["itching"],
+    "burning": ["burning sensation"],
+    "acid": ["acidity"],
+    "heartburn": ["acidity"]
+}
+
+SYMPTOM_MAPPING_MATCHER = KeywordMatcher(SYMPTOM_MAPPINGS)
+
+
+def _contains_any(text: str, phrases: Tuple[str, ...]) -> bool:
+    """Check if any phrase occurs in text."""
+    # A plain loop is about twice as fast as any() over a generator here
+    for phrase in phrases:
+        if phrase in text:
+            return True
+    return False
+
+
+@lru_cache(maxsize=PROCESS_CACHE_SIZE)
+def _partial_symptom_matches(word: str) -> Tuple[str, ...]:
+    """Return up to three known symptoms containing word, in SYMPTOM_MAP order."""
+    return tuple(islice((symptom for symptom in SYMPTOM_KEYS if word in symptom), 3))
+
+
+def _build_symptom_word_index() -> Dict[str, str]:
+    """Map each word of a known symptom to the first symptom containing it."""
+    index = {}
+    for symptom in SYMPTOM_MAP:
+        for word in symptom.split():
+            index.setdefault(word, symptom)
+    return index
+
+
+# Looked up for single-word inputs instead of splitting every symptom name
+SYMPTOM_WORD_INDEX = _build_symptom_word_index()
+
 
 class SymptomNLPProcessor:
     """Process natural language symptom descriptions."""
@@ -64,6 +185,14 @@ class SymptomNLPProcessor:
             r"suddenly": "acute",
             r"gradually": "chronic"
         }
+        self.duration_regexes = [
+            (re.compile(pattern), duration_type)
+            for pattern, duration_type in self.duration_patterns.items()
+        ]
+        # One pass decides whether any duration pattern matches at all
+        self.duration_filter = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.duration_patterns)
+        )
         
         # Question patterns for follow-up
         self.clarification_questions = {
@@ -88,10 +217,36 @@ class SymptomNLPProcessor:
                 "Are you experiencing nausea or vomiting?"
             ]
         }
+        
+        # Single-word inputs are the most common request shape, so the known
+        # words are run through the full extraction once up front
+        self.single_word_symptoms = {}
+        for word in self._single_word_vocabulary():
+            self.single_word_symptoms[word] = tuple(self._extract_symptoms(word))
+        
+        # Cached per instance rather than on the class, so the cache neither keeps
+        # processors alive nor shares results between differently configured ones.
+        # Call self._process_normalized_text.cache_clear() after changing the synonyms.
+        self._process_normalized_text = lru_cache(maxsize=PROCESS_CACHE_SIZE)(
+            self._analyze_normalized_text
+        )
 
     def process_natural_language(self, text: str) -> Dict:
         """Process natural language symptom description."""
-        text = text.lower().strip()
+        result = self._process_normalized_text(normalize_text(text))
+        # Copy the cached result's lists so callers can modify what they get back
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in result.items()
+        }
+    
+    def _analyze_normalized_text(self, text: str) -> Dict:
+        """
+        Process an already-normalized symptom description.
+        
+        Called through the per-instance cache self._process_normalized_text,
+        whose results are shared, so callers must not modify them.
+        """
         
         # Handle common conversational patterns
         if self._is_greeting(text):
@@ -129,25 +284,29 @@ class SymptomNLPProcessor:
     
     def _is_greeting(self, text: str) -> bool:
         """Check if text is a greeting."""
-        greetings = ["hello", "hi", "hey", "good morning", "good afternoon", "good evening"]
         # Don't treat emergency symptoms as greetings
-        emergency_keywords = ["chest pain", "difficulty breathing", "severe bleeding", "unconscious", "seizure"]
-        
-        if any(emergency in text for emergency in emergency_keywords):
+        if _contains_any(text, GREETING_EMERGENCY_KEYWORDS):
             return False
             
-        return any(greeting in text for greeting in greetings)
+        return _contains_any(text, GREETINGS)
     
     def _is_question_about_system(self, text: str) -> bool:
         """Check if user is asking about the system."""
-        system_questions = [
-            "what can you do", "how do you work", "what are you",
-            "help me", "what is this", "how does this work"
-        ]
-        return any(question in text for question in system_questions)
+        return _contains_any(text, SYSTEM_QUESTIONS)
+    
+    def _single_word_vocabulary(self) -> List[str]:
+        """List the single words the extraction knows about."""
+        words = list(SYMPTOM_WORD_INDEX)
+        words.extend(synonym for synonym in self.symptom_synonyms if " " not in synonym)
+        words.extend(key for key in SYMPTOM_MAPPINGS if " " not in key)
+        return list(dict.fromkeys(words))
     
     def _extract_symptoms(self, text: str) -> List[str]:
         """Extract and normalize symptoms from text."""
+        precomputed = self.single_word_symptoms.get(text)
+        if precomputed is not None:
+            return list(precomputed)
+        
         symptoms = []
         
         # Replace synonyms first
@@ -157,10 +316,7 @@ class SymptomNLPProcessor:
                 normalized_text = normalized_text.replace(synonym, standard)
         
         # Direct symptom matching from our database (prioritize exact matches)
-        from .symptoms import SYMPTOM_MAP
-        for symptom in SYMPTOM_MAP.keys():
-            if symptom in normalized_text:
-                symptoms.append(symptom)
+        symptoms.extend(SYMPTOM_MATCHER.find_all(normalized_text))
         
         # If no direct matches found, try more aggressive extraction
         if not symptoms:
@@ -174,30 +330,20 @@ class SymptomNLPProcessor:
                 # Partial matching for single words
                 words = cleaned_input.split()
                 if len(words) == 1:
-                    word = words[0]
                     # Check if this word is part of any known symptom
-                    for symptom in SYMPTOM_MAP.keys():
-                        if word in symptom.split():
-                            symptoms.append(symptom)
-                            break
+                    symptom = SYMPTOM_WORD_INDEX.get(words[0])
+                    if symptom:
+                        symptoms.append(symptom)
         
         # Enhanced symptom extraction patterns
         if not symptoms:
-            symptom_patterns = [
-                r"i have (?:a |an |some |really |very |quite |pretty |)?(?:bad |severe |terrible |awful |mild |slight |little |minor |)?(.*?)(?:\s+and|\s*,|\s*$|\s+that|\s+which)",
-                r"i'm feeling (.*?)(?:\s+and|\s*,|\s*$)",
-                r"experiencing (.*?)(?:\s+and|\s*,|\s*$)",
-                r"my (.*?) (?:hurts?|aches?|is sore|feels? bad|feels? terrible|really hurts?)",
-                r"(headache|fever|nausea|vomiting|cough|pain|ache|sick|hurt|hurts)",
-                r"feeling (nauseous|sick|dizzy|tired|weak|feverish)",
-                r"(itching|burning|throbbing|sharp|dull) (?:pain|sensation|feeling)",
-                r"(?:really |very |quite |)?(sick|nauseous|hurt|pain|ache|fever|headache|cough)",
-                r"stomach (?:really |very |)?(?:hurts?|aches?|pain)",
-                r"feel (?:really |very |)?sick"
-            ]
+            if LINEAR_SYMPTOM_PATTERNS is not None and len(normalized_text) >= LONG_TEXT_LENGTH:
+                symptom_patterns = LINEAR_SYMPTOM_PATTERNS
+            else:
+                symptom_patterns = SYMPTOM_PATTERNS
             
             for pattern in symptom_patterns:
-                matches = re.findall(pattern, normalized_text, re.IGNORECASE)
+                matches = pattern.findall(normalized_text)
                 for match in matches:
                     if isinstance(match, tuple):
                         match = match[0] if match[0] else match[1] if len(match) > 1 else ""
@@ -209,22 +355,23 @@ class SymptomNLPProcessor:
                         if mapped_symptom:
                             symptoms.extend(mapped_symptom)
         
-        # Special case handling for complex phrases
-        if "stomach" in normalized_text and ("hurt" in normalized_text or "pain" in normalized_text):
+        # Special case handling for complex phrases (each word is looked up once)
+        mentions_stomach = "stomach" in normalized_text
+        mentions_hurt = "hurt" in normalized_text or "pain" in normalized_text
+        
+        if mentions_stomach and mentions_hurt:
             symptoms.append("stomach pain")
         
-        if "sick" in normalized_text and "stomach" in normalized_text:
+        if mentions_stomach and "sick" in normalized_text:
             symptoms.append("vomiting")
         
-        if "head" in normalized_text and ("hurt" in normalized_text or "pain" in normalized_text):
+        if mentions_hurt and "head" in normalized_text:
             symptoms.append("headache")
         
-        return list(set(symptoms))  # Remove duplicates
+        return list(dict.fromkeys(symptoms))  # Remove duplicates, keeping match order
     
     def _map_to_known_symptoms(self, symptom_text: str) -> List[str]:
         """Map extracted text to known symptoms in our database."""
-        from .symptoms import SYMPTOM_MAP
-        
         mapped = []
         symptom_text = symptom_text.lower()
         
@@ -234,39 +381,8 @@ class SymptomNLPProcessor:
             return mapped
         
         # Partial matches and mappings
-        symptom_mappings = {
-            "headache": ["headache"],
-            "head pain": ["headache"],
-            "nauseous": ["vomiting"],
-            "sick": ["vomiting"],
-            "queasy": ["vomiting"],
-            "stomach": ["stomach pain"],
-            "belly": ["stomach pain"],
-            "tummy": ["stomach pain"],
-            "throat": ["sore throat"],
-            "nose": ["runny nose"],
-            "stuffy": ["runny nose"],
-            "congested": ["runny nose"],
-            "temperature": ["fever"],
-            "hot": ["fever"],
-            "chills": ["fever"],
-            "shivering": ["fever"],
-            "ache": ["body pain"],
-            "aches": ["body pain"],
-            "tired": ["fatigue"],
-            "exhausted": ["fatigue"],
-            "weak": ["fatigue"],
-            "rash": ["skin rash"],
-            "itchy": ["itching"],
-            "scratchy": ["itching"],
-            "burning": ["burning sensation"],
-            "acid": ["acidity"],
-            "heartburn": ["acidity"]
-        }
-        
-        for key, symptoms in symptom_mappings.items():
-            if key in symptom_text:
-                mapped.extend(symptoms)
+        for key in SYMPTOM_MAPPING_MATCHER.find_all(symptom_text):
+            mapped.extend(SYMPTOM_MAPPINGS[key])
         
         # Check for compound symptoms
         if "head" in symptom_text and ("pain" in symptom_text or "ache" in symptom_text or "hurt" in symptom_text):
@@ -286,10 +402,7 @@ class SymptomNLPProcessor:
     def _clean_symptom_text(self, text: str) -> str:
         """Clean and normalize symptom text."""
         # Remove common filler words
-        filler_words = ["a", "an", "the", "some", "really", "very", "quite", "pretty", "kind of"]
-        words = text.split()
-        cleaned_words = [word for word in words if word not in filler_words]
-        return " ".join(cleaned_words)
+        return " ".join(word for word in text.split() if word not in FILLER_WORDS)
     
     def _extract_intensity(self, text: str) -> str:
         """Extract symptom intensity."""
@@ -305,8 +418,12 @@ class SymptomNLPProcessor:
     
     def _extract_duration(self, text: str) -> str:
         """Extract symptom duration."""
-        for pattern, duration_type in self.duration_patterns.items():
-            if re.search(pattern, text):
+        if not self.duration_filter.search(text):
+            return "unknown"
+        
+        # Patterns are checked in order, so the first listed match still wins
+        for pattern, duration_type in self.duration_regexes:
+            if pattern.search(text):
                 return duration_type
         return "unknown"
     
@@ -318,14 +435,13 @@ class SymptomNLPProcessor:
             word = text.lower().strip()
             
             # Check if it's a known symptom
-            from .symptoms import SYMPTOM_MAP
             if word in SYMPTOM_MAP:
                 return f"I see you mentioned '{word}'. Let me analyze that for you. For a more complete assessment, you could also tell me about any other symptoms you're experiencing."
             
             # Check if it's a partial symptom match
-            partial_matches = [symptom for symptom in SYMPTOM_MAP.keys() if word in symptom]
+            partial_matches = _partial_symptom_matches(word)
             if partial_matches:
-                return f"I see you mentioned '{word}'. This could relate to: {', '.join(partial_matches[:3])}. Could you be more specific about your symptoms?"
+                return f"I see you mentioned '{word}'. This could relate to: {', '.join(partial_matches)}. Could you be more specific about your symptoms?"
         
         responses = [
             "I'd like to help you better. Could you describe your symptoms more specifically?",
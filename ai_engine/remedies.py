@@ -4,14 +4,40 @@ Natural Remedy Knowledge Base
 
 import json
 import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from .data_files import load_json_file
+
+REMEDY_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'remedies.json')
+
+
+@lru_cache(maxsize=None)
+def load_remedy_file():
+    """
+    Parse remedies.json once per process.
+    
+    The remedy, precaution and emergency loaders all read from this shared,
+    read-only view instead of parsing the file themselves.
+    """
+    return MappingProxyType(load_json_file(REMEDY_DATA_PATH))
+
 
 def load_remedy_database():
     """Load remedy database from JSON file."""
     try:
-        data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'remedies.json')
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-        return data.get('remedy_database', {}), data.get('disease_precautions', {})
+        data = load_remedy_file()
+        # Interned keys let lookups by interned SYMPTOM_MAP conditions match by identity
+        remedy_database = {
+            sys.intern(condition): remedies
+            for condition, remedies in data.get('remedy_database', {}).items()
+        }
+        precautions_database = {
+            sys.intern(condition): precautions
+            for condition, precautions in data.get('disease_precautions', {}).items()
+        }
+        return remedy_database, precautions_database
     except (FileNotFoundError, KeyError, json.JSONDecodeError):
         # Fallback to hardcoded data if JSON file is not available
         return {
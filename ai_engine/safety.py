@@ -3,15 +3,15 @@ Emergency Detection Logic
 """
 
 import json
-import os
+
+from .keyword_matcher import KeywordMatcher
+from .remedies import load_remedy_file
+from .text_normalization import normalize_text
 
 def load_emergency_symptoms():
     """Load emergency symptoms from JSON file."""
     try:
-        data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'remedies.json')
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-        return data['emergency_symptoms']
+        return load_remedy_file()['emergency_symptoms']
     except (FileNotFoundError, KeyError, json.JSONDecodeError):
         # Fallback to hardcoded data if JSON file is not available
         return [
@@ -27,20 +27,27 @@ def load_emergency_symptoms():
 
 EMERGENCY_SYMPTOMS = load_emergency_symptoms()
 
+# Built once so a long emergency list is still checked in a single pass
+EMERGENCY_MATCHER = KeywordMatcher(EMERGENCY_SYMPTOMS)
+
 
 def check_emergency(symptom_text: str):
     """
     Detect emergency symptoms.
     """
-    symptom_text = symptom_text.lower()
-
-    for danger in EMERGENCY_SYMPTOMS:
-        if danger in symptom_text:
-            return {
-                "emergency": True,
-                "level": "critical",
-                "message": "Possible medical emergency detected. Seek immediate medical help."
-            }
+    return _check_emergency_normalized(normalize_text(symptom_text))
+
+
+def _check_emergency_normalized(symptom_text: str):
+    """
+    Detect emergency symptoms in already-normalized text.
+    """
+    if EMERGENCY_MATCHER.contains_any(symptom_text):
+        return {
+            "emergency": True,
+            "level": "critical",
+            "message": "Possible medical emergency detected. Seek immediate medical help."
+        }
 
     return {
         "emergency": False,
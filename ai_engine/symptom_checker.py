@@ -3,50 +3,198 @@ Comprehensive Symptom Checker
 Interactive symptom analysis with guided questions and differential diagnosis
 """
 
+import sys
+from itertools import islice
+from types import MappingProxyType
 from typing import List, Dict, Set, Tuple
 from .advanced_diagnosis import AdvancedDiagnosisEngine
-from .enhanced_remedies import EnhancedRemedySystem
-from .safety import check_emergency
+from .enhanced_remedies import get_emergency_remedies, get_remedy_system
+from .safety import _check_emergency_normalized
+from .text_normalization import normalize_text
+
+
+def _intern_conditions(table):
+    """
+    Intern the condition names keying a static table.
+    
+    Literals containing spaces are not interned by the compiler, so without
+    this the interned condition names from the symptom data would only match
+    them after a full string comparison.
+    """
+    if isinstance(table, dict):
+        return MappingProxyType({sys.intern(condition): value for condition, value in table.items()})
+    return frozenset(map(sys.intern, table))
+
+
+# Conditions needing prompt medical attention regardless of confidence
+HIGH_URGENCY_CONDITIONS = _intern_conditions({
+    'heart attack', 'paralysis (brain hemorrhage)', 'hepatitis e',
+    'acute liver failure', 'pneumonia'
+})
+
+MEDIUM_URGENCY_CONDITIONS = _intern_conditions({
+    'diabetes', 'hypertension', 'bronchial asthma', 'tuberculosis',
+    'hepatitis a', 'hepatitis b', 'hepatitis c'
+})
+
+HIGH_CONFIDENCE_LEVELS = frozenset({'very high', 'high'})
+
+# Answers that confirm or deny a follow-up question without describing symptoms
+AFFIRMATIVE_ANSWERS = frozenset({'yes', 'y', 'yeah', 'yep'})
+NEGATIVE_ANSWERS = frozenset({'no', 'n', 'nope', 'not really'})
+
+# Static advice tables, shared read-only by every diagnosis
+FOLLOW_UP_RECOMMENDATIONS = MappingProxyType({
+    'high': (
+        'Seek immediate medical attention',
+        'Go to emergency room or call 911',
+        'Do not delay professional medical care'
+    ),
+    'medium': (
+        'Schedule appointment with healthcare provider within 1-2 days',
+        'Monitor symptoms closely',
+        'Seek immediate care if symptoms worsen',
+        'Follow prescribed treatments if any'
+    ),
+    'low': (
+        'Monitor symptoms for 3-5 days',
+        'Try natural remedies and lifestyle changes',
+        'See healthcare provider if symptoms persist or worsen',
+        'Keep a symptom diary'
+    )
+})
+
+WARNING_SIGNS = _intern_conditions({
+    'diabetes': (
+        'Blood sugar over 300 mg/dL',
+        'Severe dehydration',
+        'Difficulty breathing',
+        'Persistent vomiting'
+    ),
+    'hypertension': (
+        'Blood pressure over 180/120',
+        'Severe headache',
+        'Chest pain',
+        'Difficulty breathing',
+        'Vision changes'
+    ),
+    'asthma': (
+        'Severe difficulty breathing',
+        'Cannot speak in full sentences',
+        'Blue lips or fingernails',
+        'Peak flow less than 50% of personal best'
+    ),
+    'common cold': (
+        'Fever over 103°F (39.4°C)',
+        'Symptoms lasting more than 10 days',
+        'Severe headache or sinus pain',
+        'Difficulty breathing'
+    )
+})
+
+DEFAULT_WARNING_SIGNS = (
+    'Symptoms significantly worsen',
+    'New concerning symptoms develop',
+    'High fever (over 103°F/39.4°C)',
+    'Difficulty breathing',
+    'Severe pain',
+    'Signs of dehydration'
+)
+
+CONDITION_OVERVIEWS = _intern_conditions({
+    'diabetes': MappingProxyType({
+        'description': 'A group of metabolic disorders characterized by high blood sugar levels',
+        'causes': ('Insulin resistance', 'Autoimmune destruction of beta cells', 'Genetic factors'),
+        'risk_factors': ('Obesity', 'Family history', 'Sedentary lifestyle', 'Age over 45'),
+        'complications': ('Heart disease', 'Kidney damage', 'Nerve damage', 'Eye problems'),
+        'prognosis': 'Well-managed diabetes allows for normal life expectancy'
+    }),
+    'hypertension': MappingProxyType({
+        'description': 'Persistently elevated blood pressure in the arteries',
+        'causes': ('Unknown (primary)', 'Kidney disease', 'Hormonal disorders', 'Medications'),
+        'risk_factors': ('Age', 'Family history', 'Obesity', 'High sodium diet', 'Stress'),
+        'complications': ('Heart attack', 'Stroke', 'Kidney disease', 'Heart failure'),
+        'prognosis': 'Excellent with proper management and lifestyle changes'
+    })
+})
 
 class ComprehensiveSymptomChecker:
     """Comprehensive symptom checker with guided diagnosis."""
     
+    __slots__ = (
+        'current_symptoms', 'answered_questions', 'session_data', 'symptom_diagnosis',
+        'symptom_text', 'symptom_phrases', 'matched_symptom_count',
+        'question_diagnosis', 'candidate_questions', '_diagnosis_engine', '_remedy_system'
+    )
+    
     def __init__(self):
-        self.diagnosis_engine = AdvancedDiagnosisEngine()
-        self.remedy_system = EnhancedRemedySystem()
-        self.current_symptoms = []
+        # Keys of a dict act as an insertion-ordered set of distinct symptoms
+        self.current_symptoms = {}
         self.answered_questions = set()
         self.session_data = {}
+        # Diagnosis of the current symptom list, reused until new symptoms arrive
+        self.symptom_diagnosis = None
+        # Running match over ' '.join(self.current_symptoms)
+        self.symptom_text = ''
+        self.symptom_phrases = set()
+        self.matched_symptom_count = 0
+        # Follow-up questions for the diagnosis they were generated from
+        self.question_diagnosis = None
+        self.candidate_questions = ()
+        # Engines are built on first use so emergency-only sessions skip them
+        self._diagnosis_engine = None
+        self._remedy_system = None
+    
+    @property
+    def diagnosis_engine(self) -> AdvancedDiagnosisEngine:
+        """Diagnosis engine, built on first use."""
+        if self._diagnosis_engine is None:
+            self._diagnosis_engine = AdvancedDiagnosisEngine()
+        return self._diagnosis_engine
+    
+    @property
+    def remedy_system(self):
+        """Shared remedy system, looked up on first use."""
+        if self._remedy_system is None:
+            self._remedy_system = get_remedy_system()
+        return self._remedy_system
     
     def start_symptom_check(self, initial_symptoms: str) -> Dict:
         """Start comprehensive symptom checking process."""
         
         # Reset session
-        self.current_symptoms = []
+        self.current_symptoms = {}
         self.answered_questions = set()
+        self.symptom_diagnosis = None
+        self.symptom_text = ''
+        self.symptom_phrases = set()
+        self.matched_symptom_count = 0
         self.session_data = {
             'initial_input': initial_symptoms,
             'emergency_checked': False,
             'diagnosis_complete': False
         }
         
+        # Normalize once for every check below
+        normalized_symptoms = normalize_text(initial_symptoms)
+        
         # Check for emergency first
-        emergency_result = check_emergency(initial_symptoms)
+        emergency_result = _check_emergency_normalized(normalized_symptoms)
         self.session_data['emergency_checked'] = True
         
         if emergency_result["emergency"]:
             return {
                 'type': 'emergency',
                 'emergency_info': emergency_result,
-                'immediate_actions': self.remedy_system.get_emergency_remedies(
+                'immediate_actions': get_emergency_remedies(
                     emergency_result.get('suspected_condition', 'general')
                 ),
                 'message': 'MEDICAL EMERGENCY DETECTED - Seek immediate professional help!'
             }
         
         # Extract initial symptoms
-        extracted_symptoms = self.diagnosis_engine.extract_symptoms_from_text(initial_symptoms)
-        self.current_symptoms.extend(extracted_symptoms)
+        extracted_symptoms = self.diagnosis_engine._extract_normalized_symptoms(normalized_symptoms)
+        self.current_symptoms.update(dict.fromkeys(extracted_symptoms))
         
         if not extracted_symptoms:
             return {
@@ -61,7 +209,7 @@ class ComprehensiveSymptomChecker:
             }
         
         # Get initial diagnosis
-        diagnosis_result = self.diagnosis_engine.advanced_diagnose(initial_symptoms)
+        diagnosis_result = self.diagnosis_engine._advanced_diagnose_normalized(normalized_symptoms)
         
         # Generate follow-up questions
         follow_up_questions = self._generate_smart_questions(diagnosis_result)
@@ -83,21 +231,27 @@ class ComprehensiveSymptomChecker:
         self.answered_questions.add(question_index)
         
         # Extract additional symptoms from answer
-        if answer.lower() in ['yes', 'y', 'yeah', 'yep']:
+        lowered_answer = answer.lower()
+        if lowered_answer in AFFIRMATIVE_ANSWERS:
             # User confirmed a symptom - we need to know which question this was for
             # This would be enhanced with question tracking
             pass
-        elif answer.lower() in ['no', 'n', 'nope', 'not really']:
+        elif lowered_answer in NEGATIVE_ANSWERS:
             # User denied a symptom
             pass
         else:
             # User provided descriptive answer - extract symptoms
             additional_symptoms = self.diagnosis_engine.extract_symptoms_from_text(answer)
-            self.current_symptoms.extend(additional_symptoms)
+            self.current_symptoms.update(dict.fromkeys(additional_symptoms))
         
-        # Re-analyze with updated symptoms
-        combined_symptoms_text = ' '.join(self.current_symptoms)
-        updated_diagnosis = self.diagnosis_engine.advanced_diagnose(combined_symptoms_text)
+        # Re-analyze only when the updated symptoms match new phrases
+        if self._match_new_symptoms() or self.symptom_diagnosis is None:
+            engine = self.diagnosis_engine
+            phrases = sorted(self.symptom_phrases, key=engine.phrase_order.__getitem__)
+            self.symptom_diagnosis = engine._diagnose_extracted_symptoms(
+                engine._symptoms_from_phrases(phrases)
+            )
+        updated_diagnosis = self.symptom_diagnosis
         
         # Check if we need more questions
         remaining_questions = self._generate_smart_questions(updated_diagnosis)
@@ -113,39 +267,68 @@ class ComprehensiveSymptomChecker:
             'progress': f"{len(self.answered_questions)}/5 questions answered"
         }
     
+    def _match_new_symptoms(self) -> bool:
+        """
+        Extend the running phrase match with symptoms added since the last turn.
+        
+        Gives the same phrases as matching ' '.join(self.current_symptoms) from
+        scratch, but only scans the new symptoms plus enough of the earlier text
+        to catch a phrase spanning the join.
+        
+        Returns:
+            True if any previously unmatched phrase was found
+        """
+        new_symptoms = list(islice(self.current_symptoms, self.matched_symptom_count, None))
+        if not new_symptoms:
+            return False
+        self.matched_symptom_count = len(self.current_symptoms)
+        
+        new_text = normalize_text(' '.join(new_symptoms))
+        if self.symptom_text:
+            new_text = ' ' + new_text
+            overlap = self.diagnosis_engine.max_phrase_length - 1
+            scan_text = self.symptom_text[max(0, len(self.symptom_text) - overlap):] + new_text
+        else:
+            scan_text = new_text
+        self.symptom_text += new_text
+        
+        phrase_count = len(self.symptom_phrases)
+        self.symptom_phrases.update(self.diagnosis_engine.symptom_matcher.find_all(scan_text))
+        return len(self.symptom_phrases) > phrase_count
+    
     def _generate_smart_questions(self, diagnosis_result: Dict) -> List[str]:
         """Generate smart follow-up questions based on current diagnosis."""
         
         if not diagnosis_result.get('primary_diagnosis'):
             return []
         
-        primary_condition = diagnosis_result['primary_diagnosis']['condition']
-        current_symptoms = diagnosis_result.get('extracted_symptoms', [])
-        
-        # Get condition-specific questions
-        questions = self.diagnosis_engine.get_symptom_checker_questions(
-            current_symptoms, primary_condition
-        )
-        
-        # Filter out already answered questions
-        filtered_questions = []
-        for i, question in enumerate(questions):
-            if i not in self.answered_questions and len(filtered_questions) < 3:
-                filtered_questions.append(question)
+        # A reused diagnosis (e.g. after a yes/no answer) keeps its questions
+        if diagnosis_result is not self.question_diagnosis:
+            primary_condition = diagnosis_result['primary_diagnosis']['condition']
+            current_symptoms = diagnosis_result.get('extracted_symptoms', [])
+            
+            # Get condition-specific questions
+            self.candidate_questions = self.diagnosis_engine.get_symptom_checker_questions(
+                current_symptoms, primary_condition
+            )
+            self.question_diagnosis = diagnosis_result
+        questions = self.candidate_questions
         
-        return filtered_questions
+        # First three questions not already answered, stopping once they are found
+        return list(islice(
+            (question for i, question in enumerate(questions) if i not in self.answered_questions),
+            3
+        ))
     
     def _generate_final_diagnosis(self, diagnosis_result: Dict) -> Dict:
         """Generate final comprehensive diagnosis with treatment recommendations."""
         
         primary_diagnosis = diagnosis_result['primary_diagnosis']
-        condition = primary_diagnosis['condition']
+        # Interned once so the table lookups below match the literal keys by identity
+        condition = sys.intern(primary_diagnosis['condition'])
         
         # Get comprehensive treatment information
-        remedies = self.remedy_system.get_remedies(condition)
-        precautions = self.remedy_system.get_precautions(condition)
-        lifestyle_recommendations = self.remedy_system.get_lifestyle_recommendations(condition)
-        dietary_recommendations = self.remedy_system.get_dietary_recommendations(condition)
+        condition_info = self.remedy_system.get_condition_info(condition)
         
         # Determine urgency level
         urgency = self._determine_urgency(condition, primary_diagnosis['confidence'])
@@ -155,10 +338,10 @@ class ComprehensiveSymptomChecker:
             'primary_diagnosis': primary_diagnosis,
             'differential_diagnosis': diagnosis_result.get('differential_diagnosis', []),
             'treatment_plan': {
-                'natural_remedies': remedies,
-                'medical_precautions': precautions,
-                'lifestyle_changes': lifestyle_recommendations,
-                'dietary_recommendations': dietary_recommendations
+                'natural_remedies': condition_info['remedies'],
+                'medical_precautions': condition_info['precautions'],
+                'lifestyle_changes': condition_info['lifestyle'],
+                'dietary_recommendations': condition_info['diet']
             },
             'urgency_level': urgency,
             'follow_up_recommendations': self._get_follow_up_recommendations(condition, urgency),
@@ -167,117 +350,41 @@ class ComprehensiveSymptomChecker:
             'session_summary': {
                 'initial_input': self.session_data.get('initial_input', ''),
                 'questions_answered': len(self.answered_questions),
-                'symptoms_identified': self.current_symptoms
+                'symptoms_identified': list(self.current_symptoms)
             }
         }
     
     def _determine_urgency(self, condition: str, confidence: str) -> str:
         """Determine urgency level for medical attention."""
         
-        high_urgency_conditions = [
-            'heart attack', 'paralysis (brain hemorrhage)', 'hepatitis e',
-            'acute liver failure', 'pneumonia'
-        ]
-        
-        medium_urgency_conditions = [
-            'diabetes', 'hypertension', 'bronchial asthma', 'tuberculosis',
-            'hepatitis a', 'hepatitis b', 'hepatitis c'
-        ]
-        
-        if condition in high_urgency_conditions:
+        if condition in HIGH_URGENCY_CONDITIONS:
             return 'high'
-        elif condition in medium_urgency_conditions:
+        elif condition in MEDIUM_URGENCY_CONDITIONS:
             return 'medium'
-        elif confidence in ['very high', 'high']:
+        elif confidence in HIGH_CONFIDENCE_LEVELS:
             return 'medium'
         else:
             return 'low'
     
     def _get_follow_up_recommendations(self, condition: str, urgency: str) -> List[str]:
         """Get follow-up recommendations based on condition and urgency."""
-        
-        if urgency == 'high':
-            return [
-                'Seek immediate medical attention',
-                'Go to emergency room or call 911',
-                'Do not delay professional medical care'
-            ]
-        elif urgency == 'medium':
-            return [
-                'Schedule appointment with healthcare provider within 1-2 days',
-                'Monitor symptoms closely',
-                'Seek immediate care if symptoms worsen',
-                'Follow prescribed treatments if any'
-            ]
-        else:
-            return [
-                'Monitor symptoms for 3-5 days',
-                'Try natural remedies and lifestyle changes',
-                'See healthcare provider if symptoms persist or worsen',
-                'Keep a symptom diary'
-            ]
+        return list(FOLLOW_UP_RECOMMENDATIONS.get(urgency, FOLLOW_UP_RECOMMENDATIONS['low']))
     
     def _get_when_to_seek_help(self, condition: str) -> List[str]:
         """Get specific warning signs for when to seek immediate help."""
-        
-        warning_signs = {
-            'diabetes': [
-                'Blood sugar over 300 mg/dL',
-                'Severe dehydration',
-                'Difficulty breathing',
-                'Persistent vomiting'
-            ],
-            'hypertension': [
-                'Blood pressure over 180/120',
-                'Severe headache',
-                'Chest pain',
-                'Difficulty breathing',
-                'Vision changes'
-            ],
-            'asthma': [
-                'Severe difficulty breathing',
-                'Cannot speak in full sentences',
-                'Blue lips or fingernails',
-                'Peak flow less than 50% of personal best'
-            ],
-            'common cold': [
-                'Fever over 103°F (39.4°C)',
-                'Symptoms lasting more than 10 days',
-                'Severe headache or sinus pain',
-                'Difficulty breathing'
-            ]
-        }
-        
-        return warning_signs.get(condition, [
-            'Symptoms significantly worsen',
-            'New concerning symptoms develop',
-            'High fever (over 103°F/39.4°C)',
-            'Difficulty breathing',
-            'Severe pain',
-            'Signs of dehydration'
-        ])
+        return list(WARNING_SIGNS.get(condition, DEFAULT_WARNING_SIGNS))
     
     def get_condition_overview(self, condition: str) -> Dict:
         """Get comprehensive overview of a medical condition."""
-        
-        condition_overviews = {
-            'diabetes': {
-                'description': 'A group of metabolic disorders characterized by high blood sugar levels',
-                'causes': ['Insulin resistance', 'Autoimmune destruction of beta cells', 'Genetic factors'],
-                'risk_factors': ['Obesity', 'Family history', 'Sedentary lifestyle', 'Age over 45'],
-                'complications': ['Heart disease', 'Kidney damage', 'Nerve damage', 'Eye problems'],
-                'prognosis': 'Well-managed diabetes allows for normal life expectancy'
-            },
-            'hypertension': {
-                'description': 'Persistently elevated blood pressure in the arteries',
-                'causes': ['Unknown (primary)', 'Kidney disease', 'Hormonal disorders', 'Medications'],
-                'risk_factors': ['Age', 'Family history', 'Obesity', 'High sodium diet', 'Stress'],
-                'complications': ['Heart attack', 'Stroke', 'Kidney disease', 'Heart failure'],
-                'prognosis': 'Excellent with proper management and lifestyle changes'
+        overview = CONDITION_OVERVIEWS.get(condition)
+        if overview is not None:
+            # Callers get their own plain dict of lists, as before the table became read-only
+            return {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in overview.items()
             }
-        }
         
-        return condition_overviews.get(condition, {
+        return {
             'description': f'Information about {condition} is being compiled.',
             'note': 'Consult healthcare provider for detailed information about this condition.'
-        })
\ No newline at end of file
+        }
@@ -4,14 +4,35 @@ Symptom to Condition Mapping
 
 import json
 import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from .data_files import load_json_file
+
+SYMPTOM_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'symptoms.json')
+
+
+@lru_cache(maxsize=None)
+def load_symptom_file():
+    """
+    Parse symptoms.json once per process.
+    
+    The symptom map and the advanced diagnosis engine both read from this
+    shared, read-only view instead of parsing the file themselves.
+    """
+    return MappingProxyType(load_json_file(SYMPTOM_DATA_PATH))
+
 
 def load_symptom_map():
     """Load symptom mapping from JSON file."""
     try:
-        data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'symptoms.json')
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-        return data['symptom_map']
+        data = load_symptom_file()
+        # Condition names repeat across symptoms; interning shares one object each
+        return {
+            sys.intern(symptom): sys.intern(condition)
+            for symptom, condition in data['symptom_map'].items()
+        }
     except (FileNotFoundError, KeyError, json.JSONDecodeError):
         # Fallback to hardcoded data if JSON file is not available
         return {
@@ -0,0 +1,13 @@
+"""
+Input Text Normalization
+"""
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize raw user input once at the API boundary.
+
+    Internal `*_normalized` helpers expect text that has already been
+    passed through this function and skip re-normalizing it.
+    """
+    return text.lower().strip()
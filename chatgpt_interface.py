@@ -6,45 +6,133 @@ Natural conversational AI for symptom analysis with advanced diagnosis
 
 import sys
 import re
-from typing import Dict
-from ai_engine import analyze_symptoms, advanced_analyze_symptoms, comprehensive_symptom_check
-from ai_engine.nlp_processor import SymptomNLPProcessor
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, Optional
+from ai_engine import analyze_symptoms, advanced_analyze_symptoms, comprehensive_symptom_check, get_nlp_processor
+from ai_engine.text_normalization import normalize_text
+
+# Messages kept per conversation; only recent turns are consulted for context
+CONVERSATION_HISTORY_LIMIT = 50
+
+# Commands that switch between analysis modes
+ADVANCED_MODE_COMMANDS = frozenset({'advanced', 'advanced mode', 'detailed analysis'})
+SIMPLE_MODE_COMMANDS = frozenset({'simple', 'simple mode', 'basic'})
+
+# Heading printed above a single-query answer
+SINGLE_QUERY_HEADER = "🤖 AI Medical Assistant:\n" + "=" * 30
+
+# Inputs that end the interactive chat
+EXIT_COMMANDS = frozenset({'quit', 'exit', 'bye', 'goodbye'})
+
+# Short answers to follow-up questions
+YES_ANSWERS = frozenset({"yes", "yeah", "yep"})
+NO_ANSWERS = frozenset({"no", "nope", "not really"})
+
+# "3 days", "2 weeks" - the number and unit shape the duration reply
+NUMERIC_DURATION_PATTERN = re.compile(r"(\d+)\s*(day|days|week|weeks|month|months)")
+
+# Any answer to a "how long" follow-up question, numeric form first so its
+# groups line up with NUMERIC_DURATION_PATTERN
+DURATION_ANSWER_PATTERN = re.compile(
+    NUMERIC_DURATION_PATTERN.pattern
+    + r"|(few|several|many)\s*(day|days|week|weeks|month|months)"
+    r"|since\s+(yesterday|last week|last month)"
+    r"|for\s+(a while|long time|some time)"
+)
+
+# Words suggesting an answer about contact with sick people
+EXPOSURE_KEYWORDS = ("around", "contact", "exposed", "family", "work", "school")
+
+# Printed once when the interactive chat starts
+CHAT_BANNER = "\n".join((
+    "🏥 AI Medical Assistant - ChatGPT Style (Enhanced)",
+    "=" * 60,
+    "Hello! I'm your AI medical assistant with advanced diagnosis capabilities.",
+    "I can help analyze symptoms, suggest natural remedies, and provide health guidance.",
+    "",
+    "💡 **New Features:**",
+    "• Type 'advanced' for detailed differential diagnosis",
+    "• Type 'simple' for basic symptom analysis",
+    "• Type 'comprehensive check' for guided symptom analysis",
+    "",
+    "Type 'quit', 'exit', or 'bye' to end our conversation.",
+    "=" * 60
+))
+
+# Condition-specific follow-up questions appended to simple diagnoses, keyed by
+# interned names so the interned conditions from SYMPTOM_MAP match by identity
+FOLLOW_UP_QUESTIONS = MappingProxyType({sys.intern(condition): questions for condition, questions in {
+    "viral infection": "\n\n**Follow-up questions:**\n• How long have you had these symptoms?\n• Have you been around anyone who was sick recently?\n• Are you getting enough rest and fluids?",
+
+    "common cold": "\n\n**Follow-up questions:**\n• Are you staying hydrated?\n• Have you tried any remedies yet?\n• Is this affecting your sleep?",
+
+    "allergy": "\n\n**Follow-up questions:**\n• Do you know what might have triggered this?\n• Have you been exposed to any new substances?\n• Do you have a history of allergies?",
+
+    "gastric issue": "\n\n**Follow-up questions:**\n• What have you eaten recently?\n• Are you experiencing this on an empty stomach?\n• Have you had similar issues before?",
+
+    "throat infection": "\n\n**Follow-up questions:**\n• Is it painful to swallow?\n• Do you see any white spots in your throat?\n• Have you tried gargling with salt water?"
+}.items()})
+
+DEFAULT_FOLLOW_UP_QUESTION = "\n\n**Is there anything else about your symptoms you'd like to discuss?**"
+
+# Lines starting with these are list items and get indented
+LIST_ITEM_PREFIXES = ('•', '-', '*', *'123456789')
+
 
 class MedicalChatBot:
     """ChatGPT-like medical diagnosis chatbot with advanced features."""
     
+    __slots__ = (
+        'nlp_processor', 'conversation_history', 'awaiting_follow_up', 'user_context', 'last_diagnosis',
+        'current_symptoms', 'advanced_mode', 'symptom_check_session'
+    )
+    
     def __init__(self):
-        self.nlp_processor = SymptomNLPProcessor()
-        self.conversation_history = []
+        # Shared across chatbots so each new conversation skips the NLP set-up
+        self.nlp_processor = get_nlp_processor()
+        self.conversation_history = deque(maxlen=CONVERSATION_HISTORY_LIMIT)
+        self.awaiting_follow_up = False  # Whether the last reply asked follow-up questions
         self.user_context = {}
         self.last_diagnosis = None  # Track last diagnosis for context
         self.current_symptoms = []  # Track current symptoms being discussed
         self.advanced_mode = False  # Toggle for advanced diagnosis
         self.symptom_check_session = None  # For comprehensive symptom checking
         
+    def _record_message(self, role: str, content: str):
+        """Append a message to the conversation history."""
+        self.conversation_history.append({"role": role, "content": content})
+    
     def process_user_input(self, user_input: str) -> str:
         """Process user input and generate ChatGPT-like response."""
         
         # Store conversation
-        self.conversation_history.append({"role": "user", "content": user_input})
+        self._record_message("user", user_input)
+        
+        # Follow-up answers only refer to the reply just before this input
+        awaiting_follow_up = self.awaiting_follow_up
+        self.awaiting_follow_up = False
+        
+        # Normalize once for the command checks below
+        normalized_input = normalize_text(user_input)
         
         # Check for mode switching commands
-        if user_input.lower().strip() in ['advanced', 'advanced mode', 'detailed analysis']:
+        if normalized_input in ADVANCED_MODE_COMMANDS:
             self.advanced_mode = True
             response = "🔬 **Advanced Mode Activated!**\n\nI'll now provide detailed differential diagnosis with multiple possible conditions, comprehensive treatment plans, and guided symptom checking.\n\nPlease describe your symptoms for advanced analysis."
-            self.conversation_history.append({"role": "assistant", "content": response})
+            self._record_message("assistant", response)
             return response
         
-        if user_input.lower().strip() in ['simple', 'simple mode', 'basic']:
+        if normalized_input in SIMPLE_MODE_COMMANDS:
             self.advanced_mode = False
             response = "✅ **Simple Mode Activated**\n\nI'll provide straightforward symptom analysis and natural remedies.\n\nHow can I help you today?"
-            self.conversation_history.append({"role": "assistant", "content": response})
+            self._record_message("assistant", response)
             return response
         
         # Check if this is a follow-up response to a previous question
-        response = self._handle_follow_up_context(user_input)
+        response = self._handle_follow_up_context(user_input, normalized_input) if awaiting_follow_up else None
         if response:
-            self.conversation_history.append({"role": "assistant", "content": response})
+            self._record_message("assistant", response)
             return response
         
         # Process with NLP
@@ -60,9 +148,8 @@ class MedicalChatBot:
         elif nlp_result["type"] == "clarification_needed":
             response = nlp_result["response"]
             if "suggestions" in nlp_result:
-                response += "\n\n**Common symptoms I can help with:**\n"
-                for suggestion in nlp_result["suggestions"]:
-                    response += f"• {suggestion}\n"
+                suggestion_lines = "".join(f"• {suggestion}\n" for suggestion in nlp_result["suggestions"])
+                response += f"\n\n**Common symptoms I can help with:**\n{suggestion_lines}"
                     
         elif nlp_result["type"] == "symptoms_found":
             # Store current symptoms for context
@@ -78,7 +165,7 @@ class MedicalChatBot:
             response = "I'm here to help with your health concerns. Please describe your symptoms and I'll do my best to provide helpful information.\n\n💡 **Tip:** Type 'advanced' for detailed analysis with multiple diagnoses."
         
         # Store response
-        self.conversation_history.append({"role": "assistant", "content": response})
+        self._record_message("assistant", response)
         
         return response
     
@@ -105,33 +192,33 @@ class MedicalChatBot:
         advanced_result = advanced_analyze_symptoms(symptoms_text)
         
         if advanced_result["type"] == "emergency":
-            response = "🚨 **MEDICAL EMERGENCY DETECTED** 🚨\n\n"
-            response += f"**Condition:** {advanced_result['emergency'].get('suspected_condition', 'Critical')}\n"
-            response += f"**Urgency:** {advanced_result['emergency']['level'].upper()}\n"
-            response += f"**Action Required:** {advanced_result['emergency']['message']}\n\n"
+            parts = ["🚨 **MEDICAL EMERGENCY DETECTED** 🚨\n\n"]
+            parts.append(f"**Condition:** {advanced_result['emergency'].get('suspected_condition', 'Critical')}\n")
+            parts.append(f"**Urgency:** {advanced_result['emergency']['level'].upper()}\n")
+            parts.append(f"**Action Required:** {advanced_result['emergency']['message']}\n\n")
             
             if advanced_result.get('emergency_remedies'):
                 emergency_remedies = advanced_result['emergency_remedies']
                 if emergency_remedies.get('immediate_actions'):
-                    response += "**Immediate Actions:**\n"
+                    parts.append("**Immediate Actions:**\n")
                     for action in emergency_remedies['immediate_actions']:
-                        response += f"• {action}\n"
-                    response += f"\n⚠️ {emergency_remedies.get('warning', '')}"
+                        parts.append(f"• {action}\n")
+                    parts.append(f"\n⚠️ {emergency_remedies.get('warning', '')}")
             
-            return response
+            return "".join(parts)
         
         elif advanced_result["type"] == "unknown":
-            response = f"🤔 **Analysis Result:** {advanced_result['message']}\n\n"
+            parts = [f"🤔 **Analysis Result:** {advanced_result['message']}\n\n"]
             
             if advanced_result.get('extracted_symptoms'):
-                response += f"**Symptoms I detected:** {', '.join(advanced_result['extracted_symptoms'])}\n\n"
+                parts.append(f"**Symptoms I detected:** {', '.join(advanced_result['extracted_symptoms'])}\n\n")
             
             if advanced_result.get('suggestions'):
-                response += "**Common symptoms I can analyze:**\n"
+                parts.append("**Common symptoms I can analyze:**\n")
                 for suggestion in advanced_result['suggestions']:
-                    response += f"• {suggestion}\n"
+                    parts.append(f"• {suggestion}\n")
             
-            return response
+            return "".join(parts)
         
         elif advanced_result["type"] == "advanced_diagnosis":
             return self._format_advanced_diagnosis(advanced_result)
@@ -140,128 +227,114 @@ class MedicalChatBot:
     
     def _format_advanced_diagnosis(self, advanced_result: Dict) -> str:
         """Format advanced diagnosis results for display."""
-        response = "🔬 **Advanced Medical Analysis**\n\n"
+        # Pieces are joined once at the end rather than concatenated one by one
+        parts = ["🔬 **Advanced Medical Analysis**\n\n"]
         
         # Primary diagnosis
         primary = advanced_result['primary_diagnosis']
-        response += f"**Primary Diagnosis:** {primary['condition'].title()}\n"
-        response += f"**Confidence Level:** {primary['confidence'].title()}"
+        parts.append(f"**Primary Diagnosis:** {primary['condition'].title()}\n")
+        parts.append(f"**Confidence Level:** {primary['confidence'].title()}")
         
         if 'score' in primary:
-            response += f" ({primary['score']:.1%})"
-        response += "\n\n"
+            parts.append(f" ({primary['score']:.1%})")
+        parts.append("\n\n")
         
         # Matching symptoms
         if primary.get('matching_symptoms'):
-            response += f"**Your symptoms that match:** {', '.join(primary['matching_symptoms'])}\n\n"
+            parts.append(f"**Your symptoms that match:** {', '.join(primary['matching_symptoms'])}\n\n")
         
         # Differential diagnosis
         if advanced_result.get('differential_diagnosis'):
-            response += "**Alternative Possibilities:**\n"
+            parts.append("**Alternative Possibilities:**\n")
             for i, alt_diagnosis in enumerate(advanced_result['differential_diagnosis'][:2], 1):
-                response += f"{i}. {alt_diagnosis['disease'].title()} (confidence: {alt_diagnosis['confidence']})\n"
-            response += "\n"
+                parts.append(f"{i}. {alt_diagnosis['disease'].title()} (confidence: {alt_diagnosis['confidence']})\n")
+            parts.append("\n")
         
         # Treatment plan
         treatment = advanced_result.get('treatment_plan', {})
         
         # Natural remedies
         if treatment.get('natural_remedies'):
-            response += "🌿 **Recommended Natural Remedies:**\n"
+            parts.append("🌿 **Recommended Natural Remedies:**\n")
             for i, remedy in enumerate(treatment['natural_remedies'][:3], 1):
-                response += f"{i}. **{remedy['remedy']}**\n"
-                response += f"   • Benefit: {remedy['benefit']}\n"
-                response += f"   • How it works: {remedy['explanation']}\n"
+                parts.append(f"{i}. **{remedy['remedy']}**\n")
+                parts.append(f"   • Benefit: {remedy['benefit']}\n")
+                parts.append(f"   • How it works: {remedy['explanation']}\n")
                 if 'usage' in remedy:
-                    response += f"   • Usage: {remedy['usage']}\n"
-                response += "\n"
+                    parts.append(f"   • Usage: {remedy['usage']}\n")
+                parts.append("\n")
         
         # Lifestyle recommendations
         if treatment.get('lifestyle_recommendations'):
-            response += "🏃 **Lifestyle Recommendations:**\n"
+            parts.append("🏃 **Lifestyle Recommendations:**\n")
             for rec in treatment['lifestyle_recommendations'][:4]:
-                response += f"• {rec}\n"
-            response += "\n"
+                parts.append(f"• {rec}\n")
+            parts.append("\n")
         
         # Dietary recommendations
         if treatment.get('dietary_recommendations'):
             dietary = treatment['dietary_recommendations']
             if dietary.get('foods_to_include'):
-                response += "🥗 **Foods to Include:**\n"
-                response += f"• {', '.join(dietary['foods_to_include'][:5])}\n\n"
+                parts.append("🥗 **Foods to Include:**\n")
+                parts.append(f"• {', '.join(dietary['foods_to_include'][:5])}\n\n")
         
         # Medical precautions
         if treatment.get('medical_precautions'):
-            response += "⚠️ **Important Precautions:**\n"
+            parts.append("⚠️ **Important Precautions:**\n")
             for precaution in treatment['medical_precautions'][:3]:
-                response += f"• {precaution}\n"
-            response += "\n"
+                parts.append(f"• {precaution}\n")
+            parts.append("\n")
         
         # Analysis summary
-        response += f"**Analysis Summary:** Analyzed {advanced_result.get('total_symptoms_analyzed', 0)} symptoms\n\n"
+        parts.append(f"**Analysis Summary:** Analyzed {advanced_result.get('total_symptoms_analyzed', 0)} symptoms\n\n")
         
         # Disclaimer
-        response += "**Important Note:** This is preliminary guidance based on symptom analysis. Please consult with a healthcare professional for proper medical diagnosis and treatment, especially if symptoms persist or worsen.\n\n"
+        parts.append("**Important Note:** This is preliminary guidance based on symptom analysis. Please consult with a healthcare professional for proper medical diagnosis and treatment, especially if symptoms persist or worsen.\n\n")
         
         # Follow-up options
-        response += "**What would you like to know more about?**\n"
-        response += "• Ask about specific remedies or treatments\n"
-        response += "• Get more details about your condition\n"
-        response += "• Discuss lifestyle changes\n"
-        response += "• Type 'comprehensive check' for guided symptom analysis"
+        parts.append("**What would you like to know more about?**\n")
+        parts.append("• Ask about specific remedies or treatments\n")
+        parts.append("• Get more details about your condition\n")
+        parts.append("• Discuss lifestyle changes\n")
+        parts.append("• Type 'comprehensive check' for guided symptom analysis")
         
-        return response
+        return "".join(parts)
     
-    def _handle_follow_up_context(self, user_input: str) -> str:
-        """Handle follow-up responses that provide additional context."""
-        
-        # Check if we have recent conversation history
-        if len(self.conversation_history) < 1:
-            return None
-        
-        # Get the last assistant message
-        last_assistant_message = None
-        for msg in reversed(self.conversation_history):
-            if msg["role"] == "assistant":
-                last_assistant_message = msg["content"]
-                break
+    def _handle_follow_up_context(self, user_input: str, normalized_input: Optional[str] = None) -> str:
+        """Handle answers to the follow-up questions asked in the previous reply."""
+        if normalized_input is None:
+            normalized_input = normalize_text(user_input)
         
-        # Check if the last message contained follow-up questions
-        if last_assistant_message and "Follow-up questions:" in last_assistant_message:
-            
-            # Handle duration responses
-            duration_patterns = [
-                r"(\d+)\s*(day|days|week|weeks|month|months)",
-                r"(few|several|many)\s*(day|days|week|weeks|month|months)",
-                r"since\s+(yesterday|last week|last month)",
-                r"for\s+(a while|long time|some time)"
-            ]
-            
-            for pattern in duration_patterns:
-                if re.search(pattern, user_input.lower()):
-                    return self._handle_duration_response(user_input)
-            
-            # Handle yes/no responses to follow-up questions
-            if user_input.lower().strip() in ["yes", "yeah", "yep", "no", "nope", "not really"]:
-                return self._handle_yes_no_response(user_input)
-            
-            # Handle exposure/contact responses
-            if any(word in user_input.lower() for word in ["around", "contact", "exposed", "family", "work", "school"]):
-                return self._handle_exposure_response(user_input)
+        # Handle duration responses
+        duration_match = DURATION_ANSWER_PATTERN.search(normalized_input)
+        if duration_match:
+            if duration_match.group(1) is None:
+                # A vague duration came first; a number may still follow it
+                duration_match = NUMERIC_DURATION_PATTERN.search(normalized_input, duration_match.end())
+            return self._handle_duration_response(user_input, duration_match)
+        
+        # Handle yes/no responses to follow-up questions
+        if normalized_input in YES_ANSWERS:
+            return self._handle_yes_no_response(user_input, confirmed=True)
+        if normalized_input in NO_ANSWERS:
+            return self._handle_yes_no_response(user_input, confirmed=False)
+        
+        # Handle exposure/contact responses
+        if any(word in normalized_input for word in EXPOSURE_KEYWORDS):
+            return self._handle_exposure_response(user_input)
         
         return None
     
-    def _handle_duration_response(self, user_input: str) -> str:
-        """Handle duration-related responses."""
-        
-        # Extract duration
-        duration_match = re.search(r"(\d+)\s*(day|days|week|weeks|month|months)", user_input.lower())
+    def _handle_duration_response(self, user_input: str, duration_match: Optional[re.Match]) -> str:
+        """Handle duration-related responses, given the numeric duration found in them."""
         
         if duration_match:
             number = duration_match.group(1)
             unit = duration_match.group(2)
+            # day(s), week(s) and month(s) are told apart by their first letter
+            unit_initial = unit[0]
             
-            if "week" in unit and int(number) >= 2:
+            if unit_initial == "w" and int(number) >= 2:
                 return f"""That's quite a long time to have these symptoms ({number} {unit}). 
 
 **For symptoms lasting this long, I strongly recommend:**
@@ -276,7 +349,7 @@ class MedicalChatBot:
 
 Is there anything else about your symptoms that has changed or worsened recently?"""
             
-            elif "day" in unit and int(number) >= 7:
+            elif unit_initial == "d" and int(number) >= 7:
                 return f"""Having symptoms for {number} {unit} suggests this might need medical attention.
 
 **I recommend:**
@@ -298,10 +371,10 @@ How are you feeling right now compared to when the symptoms started?"""
         
         return "Thank you for the additional information. Is there anything else about your symptoms you'd like to discuss?"
     
-    def _handle_yes_no_response(self, user_input: str) -> str:
+    def _handle_yes_no_response(self, user_input: str, confirmed: bool) -> str:
         """Handle yes/no responses to follow-up questions."""
         
-        if user_input.lower().strip() in ["yes", "yeah", "yep"]:
+        if confirmed:
             return """Thank you for confirming. Based on this additional information:
 
 **I recommend:**
@@ -345,35 +418,18 @@ Is there anything else about your current condition you'd like to discuss?"""
         """Generate contextual follow-up questions."""
         condition = diagnosis_result.get("diagnosis", {}).get("condition", "")
         
-        follow_ups = {
-            "viral infection": "\n\n**Follow-up questions:**\n• How long have you had these symptoms?\n• Have you been around anyone who was sick recently?\n• Are you getting enough rest and fluids?",
-            
-            "common cold": "\n\n**Follow-up questions:**\n• Are you staying hydrated?\n• Have you tried any remedies yet?\n• Is this affecting your sleep?",
-            
-            "allergy": "\n\n**Follow-up questions:**\n• Do you know what might have triggered this?\n• Have you been exposed to any new substances?\n• Do you have a history of allergies?",
-            
-            "gastric issue": "\n\n**Follow-up questions:**\n• What have you eaten recently?\n• Are you experiencing this on an empty stomach?\n• Have you had similar issues before?",
-            
-            "throat infection": "\n\n**Follow-up questions:**\n• Is it painful to swallow?\n• Do you see any white spots in your throat?\n• Have you tried gargling with salt water?"
-        }
+        follow_up = FOLLOW_UP_QUESTIONS.get(condition)
+        if follow_up is None:
+            return DEFAULT_FOLLOW_UP_QUESTION
         
-        return follow_ups.get(condition, "\n\n**Is there anything else about your symptoms you'd like to discuss?**")
+        # The next input may answer these questions
+        self.awaiting_follow_up = True
+        return follow_up
 
 def chat_interface():
     """Main chat interface like ChatGPT."""
     
-    print("🏥 AI Medical Assistant - ChatGPT Style (Enhanced)")
-    print("=" * 60)
-    print("Hello! I'm your AI medical assistant with advanced diagnosis capabilities.")
-    print("I can help analyze symptoms, suggest natural remedies, and provide health guidance.")
-    print()
-    print("💡 **New Features:**")
-    print("• Type 'advanced' for detailed differential diagnosis")
-    print("• Type 'simple' for basic symptom analysis")
-    print("• Type 'comprehensive check' for guided symptom analysis")
-    print()
-    print("Type 'quit', 'exit', or 'bye' to end our conversation.")
-    print("=" * 60)
+    print(CHAT_BANNER)
     
     chatbot = MedicalChatBot()
     
@@ -383,7 +439,7 @@ def chat_interface():
             user_input = input("\n💬 You: ").strip()
             
             # Check for exit commands
-            if user_input.lower() in ['quit', 'exit', 'bye', 'goodbye']:
+            if user_input.lower() in EXIT_COMMANDS:
                 print("\n🤖 Assistant: Take care of yourself! Remember to consult healthcare professionals for serious concerns. Goodbye! 👋")
                 break
             
@@ -392,37 +448,34 @@ def chat_interface():
                 continue
             
             # Process and respond
-            print("\n🤖 Assistant: ", end="")
             response = chatbot.process_user_input(user_input)
             
-            # Format and display response
+            # Format and display the whole reply with one write
             formatted_response = format_chat_response(response)
-            print(formatted_response)
+            print(f"\n🤖 Assistant: {formatted_response}")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
+            # Ctrl+C, or stdin closed (e.g. piped input ran out)
             print("\n\n🤖 Assistant: Goodbye! Stay healthy! 👋")
             break
         except Exception as e:
-            print(f"\n🤖 Assistant: I apologize, but I encountered an error: {e}")
-            print("Please try describing your symptoms again.")
+            print(f"\n🤖 Assistant: I apologize, but I encountered an error: {e}\n"
+                  "Please try describing your symptoms again.")
 
 def format_chat_response(response: str) -> str:
     """Format response for better readability."""
     # Add proper spacing and formatting
-    lines = response.split('\n')
     formatted_lines = []
     
-    for line in lines:
-        if line.strip():
+    for line in response.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            formatted_lines.append("")
+        elif stripped.startswith(LIST_ITEM_PREFIXES):
             # Add proper indentation for lists
-            if line.strip().startswith(('•', '-', '*')):
-                formatted_lines.append(f"  {line.strip()}")
-            elif line.strip().startswith(tuple('123456789')):
-                formatted_lines.append(f"  {line.strip()}")
-            else:
-                formatted_lines.append(line)
+            formatted_lines.append(f"  {stripped}")
         else:
-            formatted_lines.append("")
+            formatted_lines.append(line)
     
     return '\n'.join(formatted_lines)
 
@@ -433,9 +486,7 @@ def main():
         user_input = " ".join(sys.argv[1:])
         chatbot = MedicalChatBot()
         response = chatbot.process_user_input(user_input)
-        print("🤖 AI Medical Assistant:")
-        print("=" * 30)
-        print(format_chat_response(response))
+        print(f"{SINGLE_QUERY_HEADER}\n{format_chat_response(response)}")
     else:
         # Interactive chat mode
         chat_interface()
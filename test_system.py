@@ -3,7 +3,20 @@
 Simple test script for the AI Medical Diagnosis System
 """
 
-from ai_engine import analyze_symptoms
+import atexit
+import os
+import shutil
+import tempfile
+
+# Keep the caches built by these tests out of the developer's ~/.cache
+TEST_CACHE_HOME = tempfile.mkdtemp(prefix='sprout-ai-test-')
+atexit.register(shutil.rmtree, TEST_CACHE_HOME, ignore_errors=True)
+os.environ['XDG_CACHE_HOME'] = TEST_CACHE_HOME
+
+from ai_engine import analyze_symptoms, disk_cache
+
+# Also covers runs where ai_engine was imported before this module
+disk_cache.CACHE_DIR = os.path.join(TEST_CACHE_HOME, 'sprout-ai')
 
 
 def test_emergency_detection():
@@ -66,6 +79,269 @@ def test_single_word_symptoms():
     print("✓ Single-word symptoms work correctly")
 
 
+def test_keyword_matcher():
+    """Test multi-keyword symptom matching."""
+    print("Testing keyword matcher...")
+    from ai_engine.keyword_matcher import KeywordMatcher
+    matcher = KeywordMatcher(["fever", "high fever", "sore throat", "throat pain"])
+    assert matcher.find_all("high fever and sore throat pain") == [
+        "fever", "high fever", "sore throat", "throat pain"
+    ]
+    assert matcher.find_all("no symptoms here") == []
+    assert matcher.contains_any("a sore throat")
+    assert not matcher.contains_any("no symptoms here")
+    
+    from ai_engine.keyword_matcher import load_matcher
+    from ai_engine.symptoms import SYMPTOM_MAP
+    with tempfile.TemporaryDirectory() as cache_dir:
+        built = load_matcher(SYMPTOM_MAP, 'matcher.pkl', cache_dir)
+        cached = load_matcher(SYMPTOM_MAP, 'matcher.pkl', cache_dir)
+        assert cached.find_all("fever and cough") == built.find_all("fever and cough")
+        assert load_matcher(["fever"], 'matcher.pkl', cache_dir).keywords == ["fever"]
+        assert not [name for name in os.listdir(cache_dir) if name.endswith('.tmp')]
+    print("✓ Keyword matcher works")
+
+
+# Overlapping symptom phrases, enough to switch KeywordMatcher to an automaton
+MATCHER_VOCABULARY = [
+    "fever", "high fever", "mild fever", "fever and chills", "chills", "pain", "chest pain",
+    "back pain", "joint pain", "pain in chest", "ache", "headache", "stomach ache", "body ache",
+    "throat", "sore throat", "cough", "dry cough", "coughing", "nausea", "vomiting", "rash",
+    "skin rash", "itching", "fatigue", "weakness", "muscle weakness", "dizziness", "sweating",
+    "night sweats", "sneezing", "runny nose", "nose", "loss of appetite", "appetite",
+    "weight loss", "loss", "breath", "shortness of breath", "anxiety"
+]
+
+MATCHER_TEXTS = [
+    "high fever and chills with a headache",
+    "sore throat, dry coughing and a runny nose",
+    "mild fever and chills, pain in chest and chest pain",
+    "night sweats, weight loss and loss of appetite",
+    "shortness of breath with muscle weakness",
+    "headache",
+    "nothing relevant here",
+    ""
+]
+
+
+def _matcher_with_backend(keywords, backend):
+    """Build a KeywordMatcher restricted to the given backend."""
+    from ai_engine import keyword_matcher
+    installed = keyword_matcher.hyperscan, keyword_matcher.ahocorasick
+    try:
+        if backend != 'hyperscan':
+            keyword_matcher.hyperscan = None
+        if backend == 'scan':
+            keyword_matcher.ahocorasick = None
+        return keyword_matcher.KeywordMatcher(keywords)
+    finally:
+        keyword_matcher.hyperscan, keyword_matcher.ahocorasick = installed
+
+
+def _assert_matches_scan(matcher):
+    """Check a matcher against the plain substring scan on the shared vocabulary."""
+    scan = _matcher_with_backend(MATCHER_VOCABULARY, 'scan')
+    for text in MATCHER_TEXTS:
+        assert matcher.find_all(text) == scan.find_all(text), text
+        assert matcher.contains_any(text) == scan.contains_any(text), text
+
+
+def test_ahocorasick_matcher():
+    """Test that the Aho-Corasick backend matches the plain substring scan."""
+    print("Testing Aho-Corasick keyword matcher...")
+    from ai_engine.keyword_matcher import ahocorasick
+    if ahocorasick is None:
+        print("- Skipped: pyahocorasick is not installed")
+        return
+    matcher = _matcher_with_backend(MATCHER_VOCABULARY, 'ahocorasick')
+    assert matcher._automaton is not None
+    _assert_matches_scan(matcher)
+    assert matcher.find_all("high fever and chills") == [
+        "fever", "high fever", "fever and chills", "chills"
+    ]
+    print("✓ Aho-Corasick keyword matcher works")
+
+
+def test_hyperscan_matcher():
+    """Test that the Hyperscan backend matches the plain substring scan, also across threads."""
+    print("Testing Hyperscan keyword matcher...")
+    from ai_engine.keyword_matcher import hyperscan
+    if hyperscan is None:
+        print("- Skipped: hyperscan is not installed")
+        return
+    matcher = _matcher_with_backend(MATCHER_VOCABULARY, 'hyperscan')
+    assert matcher._database is not None
+    _assert_matches_scan(matcher)
+    
+    # Each thread must get its own scratch space for concurrent scans
+    from concurrent.futures import ThreadPoolExecutor
+    expected = [matcher.find_all(text) for text in MATCHER_TEXTS]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(20):
+            assert list(executor.map(matcher.find_all, MATCHER_TEXTS)) == expected
+    print("✓ Hyperscan keyword matcher works")
+
+
+def test_disk_cache():
+    """Test that derived-data caches are keyed on content and clean up after failures."""
+    print("Testing disk cache...")
+    from ai_engine.disk_cache import cache_key, load_cached, save_cached
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_path = os.path.join(cache_dir, 'data.json')
+        with open(data_path, 'w') as f:
+            f.write('{"fever": 1}')
+        key = cache_key(1, data_path)
+        save_cached('state.pkl', key, {'built': True}, cache_dir)
+        assert load_cached('state.pkl', key, cache_dir) == {'built': True}
+        assert load_cached('state.pkl', cache_key(2, data_path), cache_dir) is None
+        
+        # Same size and mtime, different contents
+        mtime = os.path.getmtime(data_path)
+        with open(data_path, 'w') as f:
+            f.write('{"cough": 1}')
+        os.utime(data_path, (mtime, mtime))
+        assert load_cached('state.pkl', cache_key(1, data_path), cache_dir) is None
+        
+        save_cached('lambda.pkl', key, lambda: None, cache_dir)
+        assert sorted(os.listdir(cache_dir)) == ['data.json', 'state.pkl']
+    print("✓ Disk cache works")
+
+
+def test_incremental_symptom_matching():
+    """Test that turn-by-turn phrase matching equals a full re-scan of all symptoms."""
+    print("Testing incremental symptom matching...")
+    from ai_engine.symptom_checker import ComprehensiveSymptomChecker
+    checker = ComprehensiveSymptomChecker()
+    engine = checker.diagnosis_engine
+    
+    def assert_matches_full_scan():
+        phrases = sorted(checker.symptom_phrases, key=engine.phrase_order.__getitem__)
+        full_text = ' '.join(checker.current_symptoms)
+        assert engine._symptoms_from_phrases(phrases) == engine.extract_symptoms_from_text(full_text)
+    
+    checker.start_symptom_check("itching and skin rash")
+    checker.answer_question(0, "I also have a high fever")
+    assert_matches_full_scan()
+    checker.answer_question(1, "and some chest pain")
+    assert_matches_full_scan()
+    
+    # "loss of appetite" and "continuous sneezing" only exist across the turn boundary
+    for turn in (["loss"], ["of"], ["appetite", "continuous"], ["sneezing"]):
+        checker.current_symptoms.update(dict.fromkeys(turn))
+        checker._match_new_symptoms()
+        assert_matches_full_scan()
+    assert {"loss of appetite", "continuous sneezing"} <= checker.symptom_phrases
+    print("✓ Incremental symptom matching works")
+
+
+def test_chatbot_follow_up_flag():
+    """Test that only the reply right after follow-up questions is treated as an answer."""
+    print("Testing chatbot follow-up tracking...")
+    from chatgpt_interface import MedicalChatBot
+    
+    class RecordingChatBot(MedicalChatBot):
+        """Chatbot that records which inputs reach the follow-up handler."""
+        def _handle_follow_up_context(self, user_input, normalized_input=None):
+            routed.append(user_input)
+            return super()._handle_follow_up_context(user_input, normalized_input)
+    
+    routed = []
+    bot = RecordingChatBot()
+    bot.process_user_input("fever and body pain")
+    assert bot.awaiting_follow_up
+    response = bot.process_user_input("for 3 days")
+    assert routed == ["for 3 days"]
+    assert "duration" in response
+    assert not bot.awaiting_follow_up
+    
+    # An unrelated reply clears the flag, so a later duration is not taken as an answer
+    bot.process_user_input("fever and body pain")
+    bot.process_user_input("hello")
+    assert not bot.awaiting_follow_up
+    bot.process_user_input("for 3 days")
+    assert routed == ["for 3 days", "hello"]
+    print("✓ Chatbot follow-up tracking works")
+
+
+def test_condition_info():
+    """Test the combined condition bundle against the individual remedy lookups."""
+    print("Testing condition info...")
+    from ai_engine.enhanced_remedies import EnhancedRemedySystem
+    remedy_system = EnhancedRemedySystem()
+    for condition in ("Diabetes", "heart attack", "unknown condition"):
+        info = remedy_system.get_condition_info(condition)
+        assert list(info['remedies']) == list(remedy_system.get_remedies(condition))
+        assert list(info['precautions']) == list(remedy_system.get_precautions(condition))
+        assert info['lifestyle'] == remedy_system.get_lifestyle_recommendations(condition)
+        assert info['diet'] == remedy_system.get_dietary_recommendations(condition)
+        assert info['emergency'] == remedy_system.get_emergency_remedies(condition)
+    
+    # Bundles are copies, so modifying one leaves the next lookup intact
+    info = remedy_system.get_condition_info("diabetes")
+    info['remedies'][0]['remedy'] = "changed"
+    info['diet']['foods_to_avoid'].clear()
+    info = remedy_system.get_condition_info("diabetes")
+    assert info['remedies'][0]['remedy'] != "changed"
+    assert info['diet']['foods_to_avoid']
+    print("✓ Condition info works")
+
+
+def test_analysis_cache():
+    """Test that cached analyses are reused but returned as independent copies."""
+    print("Testing analysis cache...")
+    analyze_symptoms.cache_clear()
+    first = analyze_symptoms("Fever and body pain")
+    first["remedies"].clear()
+    second = analyze_symptoms("  fever and body pain ")
+    assert analyze_symptoms.cache_info().hits == 1
+    assert len(second["remedies"]) > 0
+    print("✓ Analysis cache works")
+
+
+def test_batch_analysis():
+    """Test streaming analysis of several symptom descriptions."""
+    print("Testing batch analysis...")
+    from ai_engine import analyze_symptoms_iter
+    results = analyze_symptoms_iter(["fever", "sore throat"])
+    assert next(results)["diagnosis"]["condition"] == "viral infection"
+    assert next(results)["diagnosis"]["condition"] == "throat infection"
+    print("✓ Batch analysis works")
+
+
+def test_async_batch_analysis():
+    """Test that the async batch iterator yields the same results as the sync one."""
+    print("Testing async batch analysis...")
+    import asyncio
+    from ai_engine import analyze_symptoms_aiter, analyze_symptoms_iter
+    texts = ["fever", "sore throat", "chest pain", "headache"]
+    
+    async def collect(symptom_texts):
+        return [result async for result in analyze_symptoms_aiter(symptom_texts)]
+    
+    assert asyncio.run(collect(texts)) == list(analyze_symptoms_iter(texts))
+    assert asyncio.run(collect(text for text in texts)) == list(analyze_symptoms_iter(texts))
+    assert asyncio.run(collect([])) == []
+    print("✓ Async batch analysis works")
+
+
+def test_concurrent_analysis():
+    """Test that concurrent batch analysis matches sequential calls, in input order."""
+    print("Testing concurrent analysis...")
+    import asyncio
+    from ai_engine import analyze_many, analyze_many_sync
+    texts = ["fever", "sore throat", "chest pain", "headache", "itching and skin rash", "fever"]
+    expected = [analyze_symptoms(text) for text in texts]
+    
+    assert analyze_many_sync(texts, max_workers=4) == expected
+    assert analyze_many_sync(text for text in texts) == expected
+    assert analyze_many_sync([]) == []
+    
+    assert asyncio.run(analyze_many(texts, concurrency=2)) == expected
+    assert asyncio.run(analyze_many(text for text in texts)) == expected
+    assert asyncio.run(analyze_many([])) == []
+    print("✓ Concurrent analysis works")
+
+
 def main():
     """Run all tests."""
     print("🧪 Running AI Medical Diagnosis System Tests")
@@ -77,6 +353,17 @@ def main():
         test_throat_infection()
         test_enhanced_diagnosis()
         test_single_word_symptoms()
+        test_keyword_matcher()
+        test_ahocorasick_matcher()
+        test_hyperscan_matcher()
+        test_disk_cache()
+        test_incremental_symptom_matching()
+        test_chatbot_follow_up_flag()
+        test_condition_info()
+        test_analysis_cache()
+        test_batch_analysis()
+        test_async_batch_analysis()
+        test_concurrent_analysis()
         
         print("=" * 50)
         print("✅ All tests passed!")